@@ -4,7 +4,7 @@ from .dicom_rename_mr_postprocess import PostProcessManager as DicomPostProcessM
 from .dicom_rename_mr import ADCProcessingStrategy, EADCProcessingStrategy, SWANProcessingStrategy, \
     ESWANProcessingStrategy
 from .dicom_rename_mr import MRABrainProcessingStrategy, MRAVRBrainProcessingStrategy
-from .dicom_rename_mr import MRANeckProcessingStrategy, MRAVRNeckProcessingStrategy
+from .dicom_rename_mr import MRANeckProcessingStrategy, MRAVRNeckProcessingStrategy, MRAProcessingStrategy
 from .dicom_rename_mr import DwiProcessingStrategy, T1ProcessingStrategy, T2ProcessingStrategy
 from .dicom_rename_mr import ASLProcessingStrategy, DSCProcessingStrategy
 from .dicom_rename_mr import CVRProcessingStrategy, RestingProcessingStrategy, DTIProcessingStrategy
@@ -1,12 +1,17 @@
+from __future__ import annotations
+
+import functools
 import pathlib
 import re
 from enum import Enum
 from abc import ABCMeta, abstractmethod, ABC
-from typing import Tuple, Union, List
-import numpy as np
-from pydicom import FileDataset
+from typing import Dict, Tuple, Union, List, TYPE_CHECKING
 from .config import BaseEnum, NullEnum, MRSeriesRenameEnum, ModalityEnum, MRAcquisitionTypeEnum, ImageOrientationEnum, \
     ContrastEnum
+from .utils import get_data_element
+
+if TYPE_CHECKING:
+    from pydicom import FileDataset
 
 
 class ProcessingStrategy(metaclass=ABCMeta):
@@ -28,6 +33,8 @@ class SeriesProcessingStrategy(metaclass=ABCMeta):
         Metaclass for defining abstract base classes.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def process(self, dicom_ds: FileDataset) -> str:
         """
@@ -45,6 +52,25 @@ class SeriesProcessingStrategy(metaclass=ABCMeta):
         """
         pass
 
+    def batch_process(self, dicom_ds_list: List[FileDataset]) -> List[Union[Enum, BaseEnum]]:
+        """
+        Process a batch of DICOM datasets.
+
+        Subclasses can override this to share work across the batch; the default
+        processes each dataset on its own.
+
+        Parameters
+        ----------
+        dicom_ds_list : List[FileDataset]
+            The DICOM datasets to be processed.
+
+        Returns
+        -------
+        List[Union[Enum, BaseEnum]]
+            The result of processing each dataset, in the same order.
+        """
+        return [self.process(dicom_ds=dicom_ds) for dicom_ds in dicom_ds_list]
+
     def __call__(self, *args, **kwargs):
         """
         Callable method to invoke the series processing.
@@ -67,6 +93,8 @@ class ModalityProcessingStrategy(SeriesProcessingStrategy):
     ----------
     modality_list : list
         List of modalities from the ModalityEnum.
+    modality_dict : dict
+        Mapping of modality values to the ModalityEnum members.
 
     Methods
     -------
@@ -74,7 +102,10 @@ class ModalityProcessingStrategy(SeriesProcessingStrategy):
         Process the DICOM dataset based on modality and return the result.
     """
 
+    __slots__ = ()
+
     modality_list = ModalityEnum.to_list()
+    modality_dict = {modality_enum.value: modality_enum for modality_enum in modality_list}
 
     def process(self, dicom_ds: FileDataset) -> Union[Enum, BaseEnum, ImageOrientationEnum]:
         """
@@ -91,14 +122,15 @@ class ModalityProcessingStrategy(SeriesProcessingStrategy):
             The result of processing based on modality.
         """
         # Extract the modality information from the DICOM dataset
-        modality = dicom_ds.get((0x08, 0x60))
+        modality = get_data_element(dicom_ds, 0x00080060)
 
         # Check if modality information is available
         if modality:
-            # Iterate through the modality enums to find a match
-            for modality_enum in self.modality_list:
-                if modality_enum.value == modality.value:
-                    return modality_enum
+            # Look up the modality enum matching the value, a multi-valued element never matches
+            try:
+                return self.modality_dict.get(modality.value, NullEnum.NULL)
+            except TypeError:
+                pass
 
         # Return NullEnum.NULL if no match is found
         return NullEnum.NULL
@@ -114,8 +146,12 @@ class ImageOrientationProcessingStrategy(SeriesProcessingStrategy):
     -------
     process(dicom_ds: FileDataset) -> Union[BaseEnum, ImageOrientationEnum]
         Process the DICOM dataset based on image orientation and return the result.
+    classify_image_orientation(image_orientation: Tuple[float, ...]) -> Union[BaseEnum, ImageOrientationEnum]
+        Classify the plane view from the image orientation (patient) cosines.
     """
 
+    __slots__ = ()
+
     def process(self, dicom_ds: FileDataset) -> Union[BaseEnum, ImageOrientationEnum]:
         """
         Process the DICOM dataset based on image orientation.
@@ -131,29 +167,48 @@ class ImageOrientationProcessingStrategy(SeriesProcessingStrategy):
             The result of processing based on image orientation.
         """
         # Extract the image orientation information from the DICOM dataset
-        image_orientation = dicom_ds.get((0x20, 0x37))
+        image_orientation = get_data_element(dicom_ds, 0x00200037)
 
         # Return NullEnum.NULL if image orientation information is not available
         if image_orientation is None:
             return NullEnum.NULL
         else:
-            # Process the image orientation information
-            image_orientation = image_orientation.value
-            image_orientation = np.round(image_orientation)
-            image_orientation = image_orientation.astype(int)
-            image_orientation_abs = np.abs(image_orientation)
-            index_sort = np.argsort(image_orientation_abs)
-
-            # Determine the plane view based on the sorted indices
-            if ((index_sort[-1] == 0) and (index_sort[-2] == 5)) or ((index_sort[-1] == 5) and (index_sort[-2] == 0)):
-                return ImageOrientationEnum.COR
-            if ((index_sort[-1] == 1) and (index_sort[-2] == 5)) or ((index_sort[-1] == 5) and (index_sort[-2] == 1)):
-                return ImageOrientationEnum.SAG
-            if ((index_sort[-1] == 0) and (index_sort[-2] == 4)) or ((index_sort[-1] == 4) and (index_sort[-2] == 0)):
-                return ImageOrientationEnum.AXI
-
-            # Return NullEnum.NULL if no specific plane view is detected
-            return NullEnum.NULL
+            return self.classify_image_orientation(tuple(image_orientation.value))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=8192)
+    def classify_image_orientation(image_orientation: Tuple[float, ...]) -> Union[BaseEnum, ImageOrientationEnum]:
+        """
+        Classify the plane view from the image orientation (patient) cosines.
+
+        Every slice of a series shares its image orientation, and the strategies of a dataset
+        each ask for it, so the result is cached per orientation.
+
+        Parameters
+        ----------
+        image_orientation : Tuple[float, ...]
+            The six direction cosines of the image orientation (patient).
+
+        Returns
+        -------
+        Union[BaseEnum, ImageOrientationEnum]
+            The plane view, or NullEnum.NULL if no specific plane view is detected.
+        """
+        # Process the image orientation information on plain ints, the six cosines are too few for numpy
+        image_orientation_abs = [abs(int(round(value))) for value in image_orientation]
+        # Stable sort, equal values keep the order of their indices
+        index_sort = sorted(range(len(image_orientation_abs)), key=image_orientation_abs.__getitem__)
+
+        # Determine the plane view based on the sorted indices
+        if ((index_sort[-1] == 0) and (index_sort[-2] == 5)) or ((index_sort[-1] == 5) and (index_sort[-2] == 0)):
+            return ImageOrientationEnum.COR
+        if ((index_sort[-1] == 1) and (index_sort[-2] == 5)) or ((index_sort[-1] == 5) and (index_sort[-2] == 1)):
+            return ImageOrientationEnum.SAG
+        if ((index_sort[-1] == 0) and (index_sort[-2] == 4)) or ((index_sort[-1] == 4) and (index_sort[-2] == 0)):
+            return ImageOrientationEnum.AXI
+
+        # Return NullEnum.NULL if no specific plane view is detected
+        return NullEnum.NULL
 
 
 class ContrastProcessingStrategy(SeriesProcessingStrategy):
@@ -169,10 +224,13 @@ class ContrastProcessingStrategy(SeriesProcessingStrategy):
     -------
     process(dicom_ds: FileDataset) -> Union[BaseEnum, ContrastEnum]
         Process the DICOM dataset based on modality and contrast and return the result.
+    classify_series_description(series_description: str) -> ContrastEnum
+        Classify the contrast of an MR series without a contrast agent from its series description.
     """
 
+    __slots__ = ()
+
     modality_processing_strategy: ModalityProcessingStrategy = ModalityProcessingStrategy()
-    pattern = re.compile(r'(\+C|C\+)', re.IGNORECASE)
 
     def process(self, dicom_ds: FileDataset) -> Union[BaseEnum, ContrastEnum]:
         """
@@ -192,17 +250,14 @@ class ContrastProcessingStrategy(SeriesProcessingStrategy):
         modality_enum = self.modality_processing_strategy.process(dicom_ds=dicom_ds)
 
         # Extract the contrast information from the DICOM dataset
-        contrast = dicom_ds.get((0x18, 0x10))
-        series_description = dicom_ds.get((0x08, 0x103E)).value
+        contrast = get_data_element(dicom_ds, 0x00180010)
+        series_description = get_data_element(dicom_ds, 0x0008103E).value
 
         # Check modality and determine contrast category
         if modality_enum == ModalityEnum.MR:
             if contrast and len(str(contrast.value)) > 0:
                 return ContrastEnum.CE
-            result = self.pattern.search(series_description)
-            if result:
-                return ContrastEnum.CE
-            return ContrastEnum.NE
+            return self.classify_series_description(series_description)
         elif modality_enum == ModalityEnum.CT:
             if contrast:
                 return ContrastEnum.CE
@@ -212,6 +267,30 @@ class ContrastProcessingStrategy(SeriesProcessingStrategy):
         # Return NullEnum.NULL if modality is not MR or CT
         return NullEnum.NULL
 
+    @staticmethod
+    @functools.lru_cache(maxsize=8192)
+    def classify_series_description(series_description: str) -> ContrastEnum:
+        """
+        Classify the contrast from the series description.
+
+        Every slice of a series shares its series description, so the result is cached per description.
+
+        Parameters
+        ----------
+        series_description : str
+            The series description of the DICOM dataset.
+
+        Returns
+        -------
+        ContrastEnum
+            ContrastEnum.CE if the series description marks a contrast series, ContrastEnum.NE otherwise.
+        """
+        # +C or C+ in any case, a substring check is cheaper than a regex for two fixed markers
+        series_description_lower = series_description.lower()
+        if '+c' in series_description_lower or 'c+' in series_description_lower:
+            return ContrastEnum.CE
+        return ContrastEnum.NE
+
 
 class MRAcquisitionTypeProcessingStrategy(SeriesProcessingStrategy):
     """
@@ -221,6 +300,8 @@ class MRAcquisitionTypeProcessingStrategy(SeriesProcessingStrategy):
     ----------
     mr_acquisition_type_list : List[MRAcquisitionTypeEnum]
         List of MR acquisition types from MRAcquisitionTypeEnum.
+    mr_acquisition_type_dict : Dict[str, MRAcquisitionTypeEnum]
+        Mapping of MR acquisition type values to the MRAcquisitionTypeEnum members.
 
     Methods
     -------
@@ -228,7 +309,12 @@ class MRAcquisitionTypeProcessingStrategy(SeriesProcessingStrategy):
         Process the DICOM dataset based on MR acquisition type and return the result.
     """
 
+    __slots__ = ()
+
     mr_acquisition_type_list: List[MRAcquisitionTypeEnum] = MRAcquisitionTypeEnum.to_list()
+    mr_acquisition_type_dict: Dict[str, MRAcquisitionTypeEnum] = {
+        mr_acquisition_type_enum.value: mr_acquisition_type_enum
+        for mr_acquisition_type_enum in mr_acquisition_type_list}
 
     def process(self, dicom_ds: FileDataset) -> Union[BaseEnum, ImageOrientationEnum]:
         """
@@ -245,14 +331,15 @@ class MRAcquisitionTypeProcessingStrategy(SeriesProcessingStrategy):
             The result of processing based on MR acquisition type.
         """
         # Extract the MR acquisition type information from the DICOM dataset
-        mr_acquisition_type = dicom_ds.get((0x18, 0x23))
+        mr_acquisition_type = get_data_element(dicom_ds, 0x00180023)
 
         # Check if MR acquisition type information is available
         if mr_acquisition_type:
-            # Iterate through the MR acquisition type enums to find a match
-            for mr_acquisition_type_enum in self.mr_acquisition_type_list:
-                if mr_acquisition_type_enum.value == mr_acquisition_type.value:
-                    return mr_acquisition_type_enum
+            # Look up the MR acquisition type enum matching the value, a multi-valued element never matches
+            try:
+                return self.mr_acquisition_type_dict.get(mr_acquisition_type.value, NullEnum.NULL)
+            except TypeError:
+                pass
 
         # Return NullEnum.NULL if no match is found
         return NullEnum.NULL
@@ -272,20 +359,94 @@ class MRRenameSeriesProcessingStrategy(SeriesProcessingStrategy, ABC):
         An instance of ModalityProcessingStrategy used for modality processing.
     mr_acquisition_type_processing_strategy : MRAcquisitionTypeProcessingStrategy
         An instance of MRAcquisitionTypeProcessingStrategy used for MR acquisition type processing.
+    type_process_dict : Dict[Union[MRAcquisitionTypeEnum, NullEnum], Tuple[Dict, re.Pattern, Dict]]
+        The rename mapping, the alternation of its patterns and the rename lookup passed to type_process
+        for each MR acquisition type.
 
     Methods
     -------
-    process(dicom_ds: FileDataset) -> Union[MRSeriesRenameEnum, NullEnum]
+    dispatch_type_process(dicom_ds: FileDataset, mr_acquisition_type_enum) -> Union[MRSeriesRenameEnum, NullEnum]
+        Call type_process with the arguments registered for the MR acquisition type of the dataset.
+    process(dicom_ds: FileDataset, mr_acquisition_type_enum) -> Union[MRSeriesRenameEnum, NullEnum]
         Abstract method to be implemented by subclasses for processing and renaming MR series.
+    batch_process(dicom_ds_list: List[FileDataset], mr_acquisition_type_enum_list) -> List[Union[Enum, BaseEnum]]
+        Process a batch of DICOM datasets, passing on the MR acquisition type of each.
+    may_match_series_description(series_description: str, mr_acquisition_type_enum) -> bool
+        Check if a series description can be renamed by the strategy at all.
+
+    The caller that already read the MR acquisition type of a dataset passes it as mr_acquisition_type_enum,
+    so the strategies of a dataset do not each read it again. Without it, a strategy reads it from the dataset.
     """
 
+    __slots__ = ()
+
     modality: ModalityEnum = ModalityEnum.MR
     mr_acquisition_type: Tuple[Union[MRAcquisitionTypeEnum, NullEnum]] = tuple(MRAcquisitionTypeEnum.to_list())
     modality_processing_strategy: ModalityProcessingStrategy = ModalityProcessingStrategy()
     mr_acquisition_type_processing_strategy: MRAcquisitionTypeProcessingStrategy = MRAcquisitionTypeProcessingStrategy()
+    type_process_dict: Dict[Union[MRAcquisitionTypeEnum, NullEnum], Tuple[Dict, re.Pattern, Dict]] = {}
+
+    def dispatch_type_process(self, dicom_ds: FileDataset,
+                              mr_acquisition_type_enum: Union[MRAcquisitionTypeEnum, NullEnum, None] = None) -> \
+            Union[MRSeriesRenameEnum, NullEnum]:
+        """
+        Call type_process with the rename mapping, matcher and rename lookup registered for the MR acquisition type.
+
+        Strategies that rename each MR acquisition type with its own mapping list them in type_process_dict,
+        so the acquisition type is resolved once and looked up instead of compared against every type.
+
+        Parameters
+        ----------
+        dicom_ds : FileDataset
+            The DICOM dataset to be processed.
+        mr_acquisition_type_enum : Union[MRAcquisitionTypeEnum, NullEnum, None], optional
+            The MR acquisition type of the dataset, read from it when None.
+
+        Returns
+        -------
+        Union[MRSeriesRenameEnum, NullEnum]
+            The result of type_process, or NullEnum.NULL if the acquisition type is not registered.
+        """
+        if mr_acquisition_type_enum is None:
+            mr_acquisition_type_enum = self.mr_acquisition_type_processing_strategy.process(dicom_ds=dicom_ds)
+        type_process_args = self.type_process_dict.get(mr_acquisition_type_enum)
+        if type_process_args is None:
+            return NullEnum.NULL
+        return self.type_process(dicom_ds, *type_process_args)
+
+    def may_match_series_description(self, series_description: str,
+                                     mr_acquisition_type_enum: Union[MRAcquisitionTypeEnum, NullEnum]) -> bool:
+        """
+        Check if a series description can be renamed by the strategy at all.
+
+        False means process returns NullEnum.NULL for every dataset with this series description and
+        MR acquisition type, without reading any other tag first, so the caller can skip the strategy.
+        Strategies registered in type_process_dict need the alternation of the acquisition type's
+        rename mapping patterns to match; other strategies override this or always return True.
+
+        Parameters
+        ----------
+        series_description : str
+            The series description.
+        mr_acquisition_type_enum : Union[MRAcquisitionTypeEnum, NullEnum]
+            The MR acquisition type.
+
+        Returns
+        -------
+        bool
+            False if the strategy cannot rename the series description.
+        """
+        if len(self.type_process_dict) == 0:
+            return True
+        type_process_args = self.type_process_dict.get(mr_acquisition_type_enum)
+        if type_process_args is None:
+            return False
+        return type_process_args[1].match(series_description) is not None
 
     @abstractmethod
-    def process(self, dicom_ds: FileDataset) -> Union[MRSeriesRenameEnum, NullEnum]:
+    def process(self, dicom_ds: FileDataset,
+                mr_acquisition_type_enum: Union[MRAcquisitionTypeEnum, NullEnum, None] = None) -> \
+            Union[MRSeriesRenameEnum, NullEnum]:
         """
         Abstract method for processing and renaming MR series.
 
@@ -293,6 +454,8 @@ class MRRenameSeriesProcessingStrategy(SeriesProcessingStrategy, ABC):
         ----------
         dicom_ds : FileDataset
             The DICOM dataset to be processed.
+        mr_acquisition_type_enum : Union[MRAcquisitionTypeEnum, NullEnum, None], optional
+            The MR acquisition type of the dataset already read by the caller, None if it was not.
 
         Returns
         -------
@@ -301,8 +464,36 @@ class MRRenameSeriesProcessingStrategy(SeriesProcessingStrategy, ABC):
         """
         pass
 
+    def batch_process(self, dicom_ds_list: List[FileDataset],
+                      mr_acquisition_type_enum_list: Union[List[BaseEnum], None] = None) -> \
+            List[Union[Enum, BaseEnum]]:
+        """
+        Process a batch of DICOM datasets.
+
+        Subclasses can override this to share work across the batch; the default
+        processes each dataset on its own.
+
+        Parameters
+        ----------
+        dicom_ds_list : List[FileDataset]
+            The DICOM datasets to be processed.
+        mr_acquisition_type_enum_list : Union[List[BaseEnum], None], optional
+            The MR acquisition type of each dataset already read by the caller, None if they were not.
+
+        Returns
+        -------
+        List[Union[Enum, BaseEnum]]
+            The result of processing each dataset, in the same order.
+        """
+        if mr_acquisition_type_enum_list is None:
+            return [self.process(dicom_ds=dicom_ds) for dicom_ds in dicom_ds_list]
+        return [self.process(dicom_ds=dicom_ds, mr_acquisition_type_enum=mr_acquisition_type_enum)
+                for dicom_ds, mr_acquisition_type_enum in zip(dicom_ds_list, mr_acquisition_type_enum_list)]
+
 
 class CTRenameSeriesProcessingStrategy(SeriesProcessingStrategy, ABC):
+    __slots__ = ()
+
     modality: ModalityEnum = ModalityEnum.CT
     modality_processing_strategy: ModalityProcessingStrategy = ModalityProcessingStrategy()
 
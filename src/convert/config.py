@@ -3,6 +3,10 @@ from typing import Union, List
 
 
 class BaseEnum(Enum):
+    # Members are singletons compared by identity, so the identity hash is consistent with equality and
+    # skips Enum.__hash__, a Python-level hash(self._name_) paid on every set add and dict lookup of a member.
+    __hash__ = object.__hash__
+
     @classmethod
     def to_list(cls) -> List[Union[Enum,]]:
         return list(map(lambda c: c, cls))
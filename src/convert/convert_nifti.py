@@ -8,6 +8,7 @@ import dcm2niix
 import subprocess
 from concurrent.futures import ProcessPoolExecutor, Executor
 from .config import MRSeriesRenameEnum,DSCSeriesRenameEnum,ASLSEQSeriesRenameEnum
+from .utils import scandir_walk
 
 
 class Dicm2NiixConverter:
@@ -96,8 +97,9 @@ class Dicm2NiixConverter:
         executor : concurrent.futures.Executor, optional
             Executor for parallel execution.
         """
-        instances = list(self.input_path.rglob('*.dcm'))
-        study_list = list(set(list(map(lambda x: x.parent.parent, instances))))
+        study_str_set = set(map(lambda x: os.path.dirname(os.path.dirname(x)),
+                                scandir_walk(self.input_path, '.dcm')))
+        study_list = list(map(pathlib.Path, study_str_set))
         future_list = []
         for study_path in study_list:
             series_list = list(filter(lambda series_path : series_path.name != '.meta' ,study_path.iterdir()))
@@ -1,4 +1,6 @@
 import argparse
+import glob
+import os
 import pathlib
 import re
 from abc import ABCMeta, abstractmethod
@@ -25,16 +27,26 @@ class ProcessingStrategy(metaclass=ABCMeta):
         self.process(*args, **kwargs)
 
     def del_file(self, study_path):
-        for series_path in study_path.iterdir():
-            swan_pattern = self.pattern.match(series_path.name)
+        # The names are matched before any stat, and DirEntry.stat reuses what the directory listing returned
+        with os.scandir(study_path) as it:
+            entry_list = list(it)
+        for entry in entry_list:
+            swan_pattern = self.pattern.match(entry.name)
             if swan_pattern:
-                if series_path.stat().st_size < self.FILE_SIZE:
-                    print('del_file', series_path)
-                    json_file_path = series_path.parent.joinpath(series_path.name.replace(r'.nii.gz', '.json'))
-                    if json_file_path.exists():
-                        json_file_path.unlink()
-                    if series_path.exists():
-                        series_path.unlink()
+                if entry.stat().st_size < self.FILE_SIZE:
+                    print('del_file', entry.path)
+                    json_file_path = os.path.join(study_path, entry.name.replace(r'.nii.gz', '.json'))
+                    # Unlink without an exists() stat first, a file that is already gone is skipped
+                    for file_path in (json_file_path, entry.path):
+                        try:
+                            os.unlink(file_path)
+                        except FileNotFoundError:
+                            pass
+
+    def get_related_file_list(self, study_path: pathlib.Path, file_base_name: str) -> List[pathlib.Path]:
+        # Only the names starting with file_base_name are turned into paths, the stem check keeps .nii.gz out
+        return list(filter(lambda x: x.stem == file_base_name,
+                           study_path.glob(f'{glob.escape(file_base_name)}*')))
 
     def rename_file_suffix(self, series_path: pathlib.Path, pattern: re.Pattern):
         pattern_result = pattern.match(series_path.name)
@@ -70,7 +82,8 @@ class ProcessingStrategy(metaclass=ABCMeta):
                     new_file_path = self.rename_file_suffix(series_path=series_path, pattern=self.suffix_pattern)
 
                 file_base_name = series_path.name.replace('.nii.gz', '')
-                all_rename_file_list = list(filter(lambda x: x.stem == file_base_name, study_path.iterdir()))
+                all_rename_file_list = self.get_related_file_list(study_path=study_path,
+                                                                  file_base_name=file_base_name)
                 if new_file_path:
                     print(series_path, new_file_path)
                     new_file_base_name = new_file_path.name.replace('.nii.gz', '')
@@ -131,7 +144,8 @@ class ADCProcessingStrategy(ProcessingStrategy):
                     if new_file_path:
                         file_base_name = series_path.name.replace('.nii.gz', '')
                         new_file_base_name = new_file_path.name.replace('.nii.gz', '')
-                        all_rename_file_list = list(filter(lambda x: x.stem == file_base_name, study_path.iterdir()))
+                        all_rename_file_list = self.get_related_file_list(study_path=study_path,
+                                                                          file_base_name=file_base_name)
                         for rename_file in all_rename_file_list:
                             new_rename_file = new_file_path.parent.joinpath(f"{new_file_base_name}{rename_file.suffix}")
                             rename_file.rename(new_rename_file)
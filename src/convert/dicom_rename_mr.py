@@ -1,20 +1,395 @@
+from __future__ import annotations
+
+import functools
+import io
+import itertools
 import os
 import pathlib
 import re
 import shutil
+import threading
 import traceback
-from concurrent.futures import ThreadPoolExecutor
-from typing import Tuple, Union, List, Callable
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Dict, Iterator, Tuple, Union, List, Callable, TYPE_CHECKING
 
-import pydicom.errors
-from pydicom import dcmread, FileDataset
-from tqdm.auto import tqdm
+if TYPE_CHECKING:
+    from pydicom import FileDataset
 
 from .base import MRRenameSeriesProcessingStrategy, ImageOrientationProcessingStrategy, ContrastProcessingStrategy, \
     ModalityProcessingStrategy, MRAcquisitionTypeProcessingStrategy
 from .config import BaseEnum, NullEnum, MRSeriesRenameEnum, MRAcquisitionTypeEnum, SeriesEnum, T1SeriesRenameEnum, \
     ImageOrientationEnum, ContrastEnum, T2SeriesRenameEnum, ASLSEQSeriesRenameEnum, DSCSeriesRenameEnum, DTISeriesEnum, \
     RepetitionTimeEnum, BodyPartEnum
+from .patterns import FLAIR_PATTERN, CUBE_PATTERN, T2_PATTERN, DSC_PATTERN, CBF_PATTERN, CBV_PATTERN, MTT_PATTERN, \
+    DTI_PATTERN, MRA_BRAIN_PATTERN, MRA_NECK_PATTERN, MRAVR_BRAIN_PATTERN, MRAVR_NECK_PATTERN, CVR_PATTERN, \
+    RESTING_PATTERN, ADC_PATTERN, EADC_PATTERN, SWAN_PATTERN, ESWAN_PATTERN
+from .utils import get_data_element, get_required_data_element, scandir_walk
+
+# The DICOM header of a typical instance fits in the first 64KB of the file.
+PREFETCH_HEADER_SIZE = 64 * 1024
+PREFETCH_WORKERS = 16
+# Number of DICOM files read and classified together by ConvertManager.rename_process_batch.
+RENAME_BATCH_SIZE = 64
+# Number of batches ConvertManager.rename_instances_list keeps submitted to the executor at once, enough to keep
+# every worker of a typical pool busy without queueing a future per batch up front.
+RENAME_INFLIGHT_BATCH_COUNT = 32
+# Number of series descriptions whose classification each strategy caches, every slice of a series shares one.
+SERIES_DESCRIPTION_CACHE_SIZE = 1024
+# The orientation series of a REFORMATTED (0008,0008) image type, by its image orientation.
+REFORMATTED_IMAGE_ORIENTATION_DICT = {
+    ImageOrientationEnum.AXI: ImageOrientationEnum.AXIr,
+    ImageOrientationEnum.SAG: ImageOrientationEnum.SAGr,
+    ImageOrientationEnum.COR: ImageOrientationEnum.CORr,
+}
+# The stateless image orientation strategy shared by the DWI, T1 and T2 strategies.
+IMAGE_ORIENTATION_PROCESSING_STRATEGY = ImageOrientationProcessingStrategy()
+# The series group values the SWAN, eSWAN and ASL series group functions compare against, lowercased once.
+SWAN_PULSE_SEQUENCE_NAME = SeriesEnum.SWAN.value.lower()
+SWAN_PHASE_IMAGE_TYPE = SeriesEnum.SWANPHASE.value
+ESWAN_PULSE_SEQUENCE_NAME = SeriesEnum.eSWAN.value.lower()
+# The last image type (0008,0008) values of an eSWAN mIP.
+ESWAN_MIP_IMAGE_TYPE_SET = frozenset(('MIN IP', 'REFORMATTED'))
+ASL_PULSE_SEQUENCE_NAME = ASLSEQSeriesRenameEnum.ASL.value.lower()
+CBF_FUNCTIONAL_PROCESSING_NAME_SET = frozenset((ASLSEQSeriesRenameEnum.CBF.value.lower(),
+                                                ASLSEQSeriesRenameEnum.Cerebral_Blood_Flow.value.lower()))
+
+
+def is_original_image_type(dicom_ds: FileDataset) -> bool:
+    """Check if the first value of the image type (0008,0008) is ORIGINAL.
+
+    pydicom does not intern the values it decodes, so this is an equality test; the literal itself
+    is a single interned constant shared by every caller.
+
+    Parameters:
+    dicom_ds (FileDataset): The DICOM dataset.
+
+    Returns:
+    bool: True if the image type is ORIGINAL.
+    """
+    return get_data_element(dicom_ds, 0x00080008)[0] == 'ORIGINAL'
+
+
+def match_keyword_pattern(series_description: str, keyword: Union[str, Tuple[str, ...]], pattern: re.Pattern) -> bool:
+    """Check a series description against a case-insensitive '.*(keyword).*$' pattern.
+
+    For an ASCII description without a line break the pattern matches exactly when the lowercased
+    description contains the keyword, so only other descriptions go through the regex. A pattern
+    with an alternation of plain keywords, such as '.*(AUTOPWI|Perfusion).*', takes the tuple of them.
+
+    Parameters:
+    series_description (str): The series description.
+    keyword (Union[str, tuple]): The lowercase keyword of the pattern, or a tuple of its keywords.
+    pattern (re.Pattern): The compiled pattern.
+
+    Returns:
+    bool: True if the pattern matches the series description.
+    """
+    if series_description.isascii() and '\n' not in series_description:
+        series_description = series_description.lower()
+        if isinstance(keyword, tuple):
+            return any(item in series_description for item in keyword)
+        return keyword in series_description
+    return pattern.match(series_description) is not None
+
+
+def get_series_rename_matcher(series_rename_mapping: dict) -> re.Pattern:
+    """Compile the case-insensitive patterns of a rename mapping into one alternation.
+
+    Each pattern becomes a named group in mapping order. Matched at the start of a series description,
+    the alternation tries the patterns in that order, so a single match gives the first pattern of the
+    mapping that matches, or rules out the whole mapping.
+
+    Parameters:
+    series_rename_mapping (dict): Mapping of rename enumerations to their compiled patterns.
+
+    Returns:
+    re.Pattern: The combined pattern.
+    """
+    return re.compile('|'.join(f'(?P<series_rename_{index}>{series_pattern.pattern})'
+                               for index, series_pattern in enumerate(series_rename_mapping.values())),
+                      re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=SERIES_DESCRIPTION_CACHE_SIZE)
+def match_series_rename_matcher(series_rename_matcher: re.Pattern, series_description: str) -> bool:
+    """Check if any pattern of a combined rename matcher matches the series description.
+
+    Every slice of a series shares its series description, so the result is cached per matcher and
+    description.
+
+    Parameters:
+    series_rename_matcher (re.Pattern): The result of get_series_rename_matcher for a mapping.
+    series_description (str): The series description.
+
+    Returns:
+    bool: True if a pattern of the mapping matches the series description.
+    """
+    return series_rename_matcher.match(series_description) is not None
+
+
+def iter_series_rename_match(series_rename_matcher: re.Pattern, series_rename_mapping: dict,
+                             series_description: str) -> Iterator[BaseEnum]:
+    """Yield the rename enumerations of a mapping whose pattern matches the series description, in mapping order.
+
+    The combined matcher finds the first one in one pass, only the patterns after it are matched one by one.
+
+    Parameters:
+    series_rename_matcher (re.Pattern): The result of get_series_rename_matcher for the mapping.
+    series_rename_mapping (dict): Mapping of rename enumerations to their compiled patterns.
+    series_description (str): The series description.
+
+    Returns:
+    Iterator[BaseEnum]: The matching rename enumerations.
+    """
+    match_result = series_rename_matcher.match(series_description)
+    if match_result is None:
+        return
+    first_index = int(match_result.lastgroup.rpartition('_')[2])
+    series_rename_items = itertools.islice(series_rename_mapping.items(), first_index, None)
+    series_rename_enum, _ = next(series_rename_items)
+    yield series_rename_enum
+    for series_rename_enum, series_pattern in series_rename_items:
+        if series_pattern.match(series_description):
+            yield series_rename_enum
+
+
+def get_series_rename_lookup(series_rename_dict: dict) -> dict:
+    """Map each series group set of a rename dict, as a frozenset, to its rename enumeration.
+
+    When several rename enumerations share a series group set the first one is kept, the one a scan
+    of the rename dict would return.
+
+    Parameters:
+    series_rename_dict (dict): Mapping of rename enumerations to their series group sets.
+
+    Returns:
+    dict: The rename enumeration of each series group set.
+    """
+    series_rename_lookup = {}
+    for series_rename_enum, series_rename_group_set in series_rename_dict.items():
+        series_rename_lookup.setdefault(frozenset(series_rename_group_set), series_rename_enum)
+    return series_rename_lookup
+
+
+def get_series_group_bit_dict(series_rename_dict: dict) -> dict:
+    """Give each series group enum used in a rename dict its own bit.
+
+    Parameters:
+    series_rename_dict (dict): Mapping of rename enumerations to their series group sets.
+
+    Returns:
+    dict: The bit of each series group enumeration.
+    """
+    series_group_enum_list = dict.fromkeys(itertools.chain.from_iterable(series_rename_dict.values()))
+    return {series_group_enum: 1 << index for index, series_group_enum in enumerate(series_group_enum_list)}
+
+
+def get_series_group_mask(series_group_bit_dict: dict, series_group: Union[BaseEnum, Tuple[BaseEnum, ...]]) -> int:
+    """Get the bit mask of a series group enumeration or a tuple of them.
+
+    An enumeration without a bit gives -1, which matches no mask of the rename dict, the same way
+    a set containing it would equal no series group set.
+
+    Parameters:
+    series_group_bit_dict (dict): The bit of each series group enumeration.
+    series_group (Union[BaseEnum, tuple]): A series group enumeration or a tuple of them.
+
+    Returns:
+    int: The bit mask.
+    """
+    if isinstance(series_group, tuple):
+        series_group_mask = 0
+        for series_group_enum in series_group:
+            series_group_mask |= series_group_bit_dict.get(series_group_enum, -1)
+        return series_group_mask
+    return series_group_bit_dict.get(series_group, -1)
+
+
+def get_series_group_mask_lookup(series_group_bit_dict: dict, series_rename_dict: dict) -> dict:
+    """Map the bit mask of each series group set of a rename dict to its rename enumeration.
+
+    Parameters:
+    series_group_bit_dict (dict): The bit of each series group enumeration.
+    series_rename_dict (dict): Mapping of rename enumerations to their series group sets.
+
+    Returns:
+    dict: The rename enumeration of each series group mask.
+    """
+    return {get_series_group_mask(series_group_bit_dict, tuple(series_rename_group_set)): series_rename_enum
+            for series_rename_enum, series_rename_group_set in series_rename_dict.items()}
+
+
+def get_image_orientation_series_group(dicom_ds: FileDataset) -> Union[BaseEnum, ImageOrientationEnum]:
+    """Get the image orientation series group, the reformatted orientation for a REFORMATTED image type.
+
+    Shared by the DWI, T1 and T2 strategies.
+
+    Parameters:
+    dicom_ds (FileDataset): The DICOM dataset.
+
+    Returns:
+    Union[BaseEnum, ImageOrientationEnum]: Image orientation information.
+    """
+    # (0008,0008)	Image Type	DERIVED\SECONDARY\REFORMATTED
+    image_orientation = IMAGE_ORIENTATION_PROCESSING_STRATEGY.process(dicom_ds=dicom_ds)
+    image_type = get_data_element(dicom_ds, 0x00080008)
+    if image_type[2] == 'REFORMATTED':
+        return REFORMATTED_IMAGE_ORIENTATION_DICT.get(image_orientation, image_orientation)
+    return image_orientation
+
+
+def get_swan_mip_series_group(dicom_ds: FileDataset) -> Union[SeriesEnum, NullEnum]:
+    """Extract the mIP series group of a SWAN dataset.
+
+    Parameters:
+    dicom_ds (FileDataset): The DICOM dataset.
+
+    Returns:
+    Union[SeriesEnum, NullEnum]: The mIP series group or NullEnum.NULL if not found.
+    """
+    image_type = get_data_element(dicom_ds, 0x00080008)
+    instance_creation_time = get_data_element(dicom_ds, 0x00080013)
+    if image_type and instance_creation_time is not None:
+        if image_type.value[-1] == 'MIN IP':
+            return SeriesEnum.mIP
+    return NullEnum.NULL
+
+
+def get_swan_phase_series_group(dicom_ds: FileDataset) -> Union[SeriesEnum, NullEnum]:
+    """Extract the SWANPHASE series group of a SWAN dataset.
+
+    Parameters:
+    dicom_ds (FileDataset): The DICOM dataset.
+
+    Returns:
+    Union[SeriesEnum, NullEnum]: The SWANPHASE series group or NullEnum.NULL if not found.
+    """
+    image_type = get_data_element(dicom_ds, 0x0043102F)
+    if image_type:
+        if image_type.value == SWAN_PHASE_IMAGE_TYPE:
+            return SeriesEnum.SWANPHASE
+    return NullEnum.NULL
+
+
+def get_swan_series_group(dicom_ds: FileDataset) -> Union[SeriesEnum, NullEnum]:
+    """Extract the SWAN series group from the pulse sequence name (0019,109C).
+
+    Parameters:
+    dicom_ds (FileDataset): The DICOM dataset.
+
+    Returns:
+    Union[SeriesEnum, NullEnum]: The SWAN series group or NullEnum.NULL if not found.
+    """
+    pulse_sequence_name = get_data_element(dicom_ds, 0x0019109C)
+    if pulse_sequence_name:
+        if str(pulse_sequence_name.value).lower() == SWAN_PULSE_SEQUENCE_NAME:
+            return SeriesEnum.SWAN
+    return NullEnum.NULL
+
+
+def get_eswan_image_type_series_group(dicom_ds: FileDataset) -> \
+        Union[SeriesEnum, Tuple[SeriesEnum, SeriesEnum], NullEnum]:
+    """Extract the mIP and ORIGINAL series groups of an eSWAN dataset with one read of the image type.
+
+    The mIP series group is a MIN IP or REFORMATTED last image type value with an instance creation time
+    (0008,0013), the ORIGINAL series group an ORIGINAL first image type value.
+
+    Parameters:
+    dicom_ds (FileDataset): The DICOM dataset.
+
+    Returns:
+    Union[SeriesEnum, tuple, NullEnum]: The series groups found, NullEnum.NULL if none.
+    """
+    image_type = get_data_element(dicom_ds, 0x00080008)
+    if image_type is None:
+        return NullEnum.NULL
+    image_type_value = image_type.value
+    is_mip = bool(image_type) and get_data_element(dicom_ds, 0x00080013) is not None and \
+        image_type_value[-1] in ESWAN_MIP_IMAGE_TYPE_SET
+    if image_type_value[0] == 'ORIGINAL':
+        return (SeriesEnum.mIP, SeriesEnum.ORIGINAL) if is_mip else SeriesEnum.ORIGINAL
+    return SeriesEnum.mIP if is_mip else NullEnum.NULL
+
+
+def get_eswan_series_group(dicom_ds: FileDataset) -> Union[SeriesEnum, NullEnum]:
+    """Extract the eSWAN series group from the pulse sequence name (0019,109C).
+
+    Parameters:
+    dicom_ds (FileDataset): The DICOM dataset.
+
+    Returns:
+    Union[SeriesEnum, NullEnum]: The eSWAN series group or NullEnum.NULL if not found.
+    """
+    pulse_sequence_name = get_data_element(dicom_ds, 0x0019109C)
+    if pulse_sequence_name:
+        if str(pulse_sequence_name.value).lower() == ESWAN_PULSE_SEQUENCE_NAME:
+            return SeriesEnum.eSWAN
+    return NullEnum.NULL
+
+
+def get_asl_series_group(dicom_ds: FileDataset) -> Union[ASLSEQSeriesRenameEnum, NullEnum]:
+    """Extract the ASL series group from the pulse sequence name or the ASL technique.
+
+    Parameters:
+    dicom_ds (FileDataset): The DICOM dataset.
+
+    Returns:
+    Union[ASLSEQSeriesRenameEnum, NullEnum]: The ASL series group or NullEnum.NULL if not found.
+    """
+    # (0019,109C)	Unknown  Tag &  Data	ASL
+    pulse_sequence_name = get_data_element(dicom_ds, 0x0019109C)
+    if pulse_sequence_name:
+        # SIGNA Voyager (0019,109C)	Unknown  Tag &  Data	ASL
+        if str(pulse_sequence_name.value).lower() == ASL_PULSE_SEQUENCE_NAME:
+            return ASLSEQSeriesRenameEnum.ASL
+    else:
+        # MR360 (0008,103E)	Series Description	SCREENSAVE
+        # (0043,10A4)	Unknown  Tag &  Data	3D pulsed continuous ASL technique
+        ASL_technique = get_data_element(dicom_ds, 0x004310A4)
+        if ASL_technique:
+            if ASL_PULSE_SEQUENCE_NAME in str(ASL_technique.value).lower():
+                return ASLSEQSeriesRenameEnum.ASL
+    return NullEnum.NULL
+
+
+def get_asl_cbf_series_group(dicom_ds: FileDataset) -> Union[ASLSEQSeriesRenameEnum, NullEnum]:
+    """Extract the CBF series group from the functional processing name or an MR360 screen save.
+
+    Parameters:
+    dicom_ds (FileDataset): The DICOM dataset.
+
+    Returns:
+    Union[ASLSEQSeriesRenameEnum, NullEnum]: The CBF series group or NullEnum.NULL if not found.
+    """
+    functional_processing_name = get_data_element(dicom_ds, 0x00511002)
+    if functional_processing_name:
+        if str(functional_processing_name.value).lower() in CBF_FUNCTIONAL_PROCESSING_NAME_SET:
+            return ASLSEQSeriesRenameEnum.CBF
+    else:
+        # (0008,1090)	Manufacturer Model Name	MR360
+        manufacturer_model_name = get_data_element(dicom_ds, 0x00081090)
+        image_type_tag = get_data_element(dicom_ds, 0x00080008)
+        # (0008,0008)	Image Type	DERIVED\SECONDARY\SCREEN SAVE
+        # ASLSEQSeriesRenameEnum.ASLPRODCBF_COLOR get CBF
+        if 'MR360' in manufacturer_model_name.value and image_type_tag[-1] == 'SCREEN SAVE':
+            return ASLSEQSeriesRenameEnum.CBF
+    return NullEnum.NULL
+
+
+def get_color_series_group(dicom_ds: FileDataset) -> Union[ASLSEQSeriesRenameEnum, NullEnum]:
+    """Extract the COLOR series group, set when the dataset has a conversion type (0008,0064).
+
+    Parameters:
+    dicom_ds (FileDataset): The DICOM dataset.
+
+    Returns:
+    Union[ASLSEQSeriesRenameEnum, NullEnum]: The COLOR series group or NullEnum.NULL if not found.
+    """
+    # (0008,0064)	Conversion Type	WSD
+    conversion_type = get_data_element(dicom_ds, 0x00080064)
+    if conversion_type:
+        return ASLSEQSeriesRenameEnum.COLOR
+    return NullEnum.NULL
 
 
 class DwiProcessingStrategy(MRRenameSeriesProcessingStrategy):
@@ -27,8 +402,12 @@ class DwiProcessingStrategy(MRRenameSeriesProcessingStrategy):
         Tuple containing MR acquisition types, in this case, only 2D.
     pattern : re.Pattern
         Regular expression pattern for series description matching DWI or AUTODIFF, case insensitive.
+    b_values_dict : dict
+        Mapping of integer b-values to their MRSeriesRenameEnum values.
     """
 
+    __slots__ = ()
+
     type_2D_series_rename_mapping = {
         MRSeriesRenameEnum.DWI: re.compile('.*(DWI|AUTODIFF).*', re.IGNORECASE),
     }
@@ -39,102 +418,63 @@ class DwiProcessingStrategy(MRRenameSeriesProcessingStrategy):
         MRSeriesRenameEnum.DWI1000: {MRSeriesRenameEnum.DWI, MRSeriesRenameEnum.B_VALUES_1000,
                                      ImageOrientationEnum.AXI},
     }
-    image_orientation_processing_strategy = ImageOrientationProcessingStrategy()
-    series_group_fn_list = []
-
-    @classmethod
-    def get_series_group_fn_list(cls):
-        """Get the list of series group functions.
-
-        Returns:
-        list: List of functions for extracting series group information.
-        """
-        if len(cls.series_group_fn_list) == 0:
-            cls.series_group_fn_list.append(cls.get_image_orientation)
-            cls.series_group_fn_list.append(cls.get_b_values)
-
-        return cls.series_group_fn_list
-
-    @classmethod
-    def get_image_orientation(cls, dicom_ds: FileDataset):
-        """Get the image orientation information from the DICOM dataset.
-
-        Parameters:
-        dicom_ds (FileDataset): The DICOM dataset.
+    image_orientation_processing_strategy = IMAGE_ORIENTATION_PROCESSING_STRATEGY
+    type_process_dict = {
+        MRAcquisitionTypeEnum.TYPE_2D: (type_2D_series_rename_mapping,
+                                        get_series_rename_matcher(type_2D_series_rename_mapping),
+                                        get_series_rename_lookup(type_2D_series_rename_dict)),
+    }
+    # The b-value series group of each integer b-value.
+    b_values_dict = {int(b_values_enum.value): b_values_enum
+                     for b_values_enum in (MRSeriesRenameEnum.B_VALUES_0, MRSeriesRenameEnum.B_VALUES_1000)}
 
-        Returns:
-        Union[BaseEnum, ImageOrientationEnum]: Image orientation information.
-        """
-        # (0008,0008)	Image Type	DERIVED\SECONDARY\REFORMATTED
-        image_orientation = cls.image_orientation_processing_strategy.process(dicom_ds=dicom_ds)
-        image_type = dicom_ds.get((0x08, 0x08))
-        if image_type[2] == 'REFORMATTED':
-            if image_orientation == ImageOrientationEnum.AXI:
-                return ImageOrientationEnum.AXIr
-            elif image_orientation == ImageOrientationEnum.SAG:
-                return ImageOrientationEnum.SAGr
-            elif image_orientation == ImageOrientationEnum.COR:
-                return ImageOrientationEnum.CORr
-            else:
-                return image_orientation
-        else:
-            return image_orientation
+    get_image_orientation = staticmethod(get_image_orientation_series_group)
 
     @classmethod
     def get_b_values(cls, dicom_ds: FileDataset):
-        dicom_tag = dicom_ds.get((0x43, 0x1039))
+        dicom_tag = get_data_element(dicom_ds, 0x00431039)
         if dicom_tag:
-            b_values = dicom_tag[0]
-            if int(b_values) == int(MRSeriesRenameEnum.B_VALUES_0.value):
-                return MRSeriesRenameEnum.B_VALUES_0
-            elif int(b_values) == int(MRSeriesRenameEnum.B_VALUES_1000.value):
-                return MRSeriesRenameEnum.B_VALUES_1000
-
+            return cls.b_values_dict.get(int(dicom_tag[0]), NullEnum.NULL)
         return NullEnum.NULL
 
-    def type_process(self, dicom_ds: FileDataset, type_series_rename_mapping, type_series_rename_dict) -> \
-            Union[BaseEnum, MRSeriesRenameEnum]:
+    def type_process(self, dicom_ds: FileDataset, type_series_rename_mapping, type_series_rename_matcher,
+                     type_series_rename_lookup) -> Union[BaseEnum, MRSeriesRenameEnum]:
         """Process the DICOM dataset for T1 series renaming based on acquisition type.
 
         Parameters:
         dicom_ds (FileDataset): The DICOM dataset.
         type_series_rename_mapping (dict): Mapping of series descriptions to corresponding regex patterns for the acquisition type.
-        type_series_rename_dict (dict): Mapping of T1SeriesRenameEnum values to sets of attributes for the acquisition type.
+        type_series_rename_matcher (re.Pattern): The patterns of type_series_rename_mapping as one alternation.
+        type_series_rename_lookup (dict): The T1SeriesRenameEnum value of each attribute set, as a frozenset, for the acquisition type.
 
         Returns:
         Union[BaseEnum, MRSeriesRenameEnum]: The renamed series enumeration or NullEnum.NULL if no match is found.
         """
-        series_description = dicom_ds.get((0x08, 0x103E))
-        for series_rename_enum, series_pattern in type_series_rename_mapping.items():
-            match_result = series_pattern.match(series_description.value)
-            if match_result:
-                series_group_set = set()
-                series_group_set.add(MRSeriesRenameEnum.DWI)
-                for series_group_fn in self.get_series_group_fn_list():
-                    item_enum = series_group_fn(dicom_ds=dicom_ds)
-                    if item_enum is not NullEnum.NULL:
-                        if isinstance(item_enum, tuple):
-                            series_group_set.update(item_enum)
-                        else:
-                            series_group_set.add(item_enum)
-                for series_rename_enum, series_rename_group_set in type_series_rename_dict.items():
-                    if series_group_set == series_rename_group_set:
-                        return series_rename_enum
+        series_description = get_data_element(dicom_ds, 0x0008103E)
+        # The series group does not depend on which pattern matched, so one match of the alternation decides.
+        if match_series_rename_matcher(type_series_rename_matcher, series_description.value):
+            # The two series group functions are called directly, both return a single enum.
+            image_orientation = self.get_image_orientation(dicom_ds)
+            b_values = self.get_b_values(dicom_ds)
+            series_group_set = {MRSeriesRenameEnum.DWI, image_orientation, b_values}
+            series_group_set.discard(NullEnum.NULL)
+            return type_series_rename_lookup.get(frozenset(series_group_set), NullEnum.NULL)
         return NullEnum.NULL
 
-    def process(self, dicom_ds: FileDataset) -> Union[BaseEnum, MRSeriesRenameEnum]:
+    def process(self, dicom_ds: FileDataset,
+                mr_acquisition_type_enum: Union[MRAcquisitionTypeEnum, NullEnum, None] = None) -> \
+            Union[BaseEnum, MRSeriesRenameEnum]:
         """Process the DICOM dataset for T1 series renaming.
 
         Parameters:
         dicom_ds (FileDataset): The DICOM dataset.
+        mr_acquisition_type_enum (MRAcquisitionTypeEnum): The MR acquisition type already read by the caller, read
+            from the dataset when None.
 
         Returns:
         Union[BaseEnum, MRSeriesRenameEnum]: The renamed series enumeration or NullEnum.NULL if no match is found.
         """
-        mr_acquisition_type_enum = self.mr_acquisition_type_processing_strategy.process(dicom_ds=dicom_ds)
-        if mr_acquisition_type_enum == MRAcquisitionTypeEnum.TYPE_2D:
-            return self.type_process(dicom_ds, self.type_2D_series_rename_mapping, self.type_2D_series_rename_dict)
-        return NullEnum.NULL
+        return self.dispatch_type_process(dicom_ds, mr_acquisition_type_enum)
 
 
 class ADCProcessingStrategy(MRRenameSeriesProcessingStrategy):
@@ -147,18 +487,24 @@ class ADCProcessingStrategy(MRRenameSeriesProcessingStrategy):
         Tuple containing MR acquisition types and NullEnum, in this case, 2D and NullEnum.NULL.
     """
 
+    __slots__ = ()
+
     series_rename_mapping = {
-        MRSeriesRenameEnum.ADC: re.compile('.*(?<!e)(ADC|Apparent Diffusion Coefficient).*', re.IGNORECASE),
+        MRSeriesRenameEnum.ADC: ADC_PATTERN,
     }
     mr_acquisition_type: Tuple[Union[MRAcquisitionTypeEnum, NullEnum]] = (MRAcquisitionTypeEnum.TYPE_2D,
                                                                           NullEnum.NULL)
 
-    def process(self, dicom_ds: FileDataset) -> Union[BaseEnum, MRSeriesRenameEnum]:
+    def process(self, dicom_ds: FileDataset,
+                mr_acquisition_type_enum: Union[MRAcquisitionTypeEnum, NullEnum, None] = None) -> \
+            Union[BaseEnum, MRSeriesRenameEnum]:
         """Process a DICOM dataset for ADC series renaming.
 
         Parameters:
         dicom_ds : FileDataset
             The DICOM dataset to process.
+        mr_acquisition_type_enum : MRAcquisitionTypeEnum, optional
+            The MR acquisition type already read by the caller, not needed by this strategy.
 
         Returns:
         Union[BaseEnum, MRSeriesRenameEnum]
@@ -166,17 +512,15 @@ class ADCProcessingStrategy(MRRenameSeriesProcessingStrategy):
         """
 
         # Extract relevant DICOM tags
-        image_type_tag = dicom_ds.get((0x08, 0x08))
-        instance_creation_time = dicom_ds.get((0x08, 0x13))
-        series_description = dicom_ds.get((0x08, 0x103E))
+        image_type_tag = get_data_element(dicom_ds, 0x00080008)
+        instance_creation_time = get_data_element(dicom_ds, 0x00080013)
+        series_description = get_data_element(dicom_ds, 0x0008103E)
 
         # Check if image type is 'DERIVED' and instance creation time is available
         if image_type_tag[0] == 'DERIVED' and instance_creation_time is not None:
-            # Iterate through the mapping and check for a match with the series description
-            for key, pattern in self.series_rename_mapping.items():
-                match_result = pattern.match(series_description.value)
-                if match_result:
-                    return key
+            # Check the single pattern of series_rename_mapping directly
+            if ADC_PATTERN.match(series_description.value):
+                return MRSeriesRenameEnum.ADC
 
         # If no match is found, return NullEnum.NULL
         return NullEnum.NULL
@@ -192,17 +536,36 @@ class EADCProcessingStrategy(MRRenameSeriesProcessingStrategy):
         Tuple containing MR acquisition types and NullEnum, in this case, 3D and NullEnum.NULL.
     """
 
+    __slots__ = ()
+
     series_rename_mapping = {
-        MRSeriesRenameEnum.eADC: re.compile('.*(eADC).*', re.IGNORECASE),
+        MRSeriesRenameEnum.eADC: EADC_PATTERN,
     }
     mr_acquisition_type: Tuple[Union[MRAcquisitionTypeEnum, NullEnum]] = (MRAcquisitionTypeEnum.TYPE_3D,NullEnum.NULL)
 
-    def process(self, dicom_ds: FileDataset) -> Union[BaseEnum, MRSeriesRenameEnum]:
+    def may_match_series_description(self, series_description: str,
+                                     mr_acquisition_type_enum: Union[MRAcquisitionTypeEnum, NullEnum]) -> bool:
+        """Check the series description against the eADC pattern.
+
+        Parameters:
+        series_description (str): The series description.
+        mr_acquisition_type_enum (MRAcquisitionTypeEnum): The MR acquisition type.
+
+        Returns:
+        bool: False if process returns NullEnum.NULL for the series description.
+        """
+        return match_keyword_pattern(series_description, 'eadc', EADC_PATTERN)
+
+    def process(self, dicom_ds: FileDataset,
+                mr_acquisition_type_enum: Union[MRAcquisitionTypeEnum, NullEnum, None] = None) -> \
+            Union[BaseEnum, MRSeriesRenameEnum]:
         """Process a DICOM dataset for eADC series renaming.
 
         Parameters:
         dicom_ds : FileDataset
             The DICOM dataset to process.
+        mr_acquisition_type_enum : MRAcquisitionTypeEnum, optional
+            The MR acquisition type already read by the caller, not needed by this strategy.
 
         Returns:
         Union[BaseEnum, MRSeriesRenameEnum]
@@ -210,13 +573,11 @@ class EADCProcessingStrategy(MRRenameSeriesProcessingStrategy):
         """
 
         # Extract series description from DICOM dataset
-        series_description = dicom_ds.get((0x08, 0x103E))
+        series_description = get_data_element(dicom_ds, 0x0008103E)
 
-        # Iterate through the mapping and check for a match with the series description
-        for key, pattern in self.series_rename_mapping.items():
-            match_result = pattern.match(series_description.value)
-            if match_result:
-                return key
+        # Check the single pattern of series_rename_mapping directly
+        if match_keyword_pattern(series_description.value, 'eadc', EADC_PATTERN):
+            return MRSeriesRenameEnum.eADC
 
         # If no match is found, return NullEnum.NULL
         return NullEnum.NULL
@@ -234,13 +595,16 @@ class SWANProcessingStrategy(MRRenameSeriesProcessingStrategy):
         List of functions to extract series groups for additional processing.
     series_rename_dict : dict
         Mapping of MRSeriesRenameEnum values to sets of SeriesEnum values for grouping.
+    series_rename_lookup : dict
+        The MRSeriesRenameEnum value of the bit mask of each set in series_rename_dict.
     """
 
+    __slots__ = ()
+
     series_rename_mapping = {
-        MRSeriesRenameEnum.SWAN: re.compile('.*(?<!e)(SWAN).*', re.IGNORECASE),
+        MRSeriesRenameEnum.SWAN: SWAN_PATTERN,
     }
     mr_acquisition_type: Tuple[Union[MRAcquisitionTypeEnum, NullEnum]] = (MRAcquisitionTypeEnum.TYPE_3D,)
-
     series_group_fn_list = []
 
     series_rename_dict = {
@@ -248,83 +612,65 @@ class SWANProcessingStrategy(MRRenameSeriesProcessingStrategy):
         MRSeriesRenameEnum.SWANmIP: {SeriesEnum.SWAN, SeriesEnum.mIP},
         MRSeriesRenameEnum.SWANPHASE: {SeriesEnum.SWAN, SeriesEnum.SWANPHASE},
     }
+    # Built once from series_rename_dict, the series group is looked up by the bit mask of its enums.
+    series_group_bit_dict = get_series_group_bit_dict(series_rename_dict)
+    series_rename_lookup = get_series_group_mask_lookup(series_group_bit_dict, series_rename_dict)
 
-    @classmethod
-    def get_mIP(cls, dicom_ds: FileDataset) -> Union[SeriesEnum, NullEnum]:
-        """Extract mIP series group.
-
-        Parameters:
-        dicom_ds : FileDataset
-            The DICOM dataset to process.
-
-        Returns:
-        Union[SeriesEnum, NullEnum]
-            The mIP series group or NullEnum.NULL if not found.
-        """
-        image_type = dicom_ds.get((0x08, 0x08))
-        instance_creation_time = dicom_ds.get((0x08, 0x13))
-        if image_type and instance_creation_time is not None:
-            if image_type.value[-1] == 'MIN IP':
-                return SeriesEnum.mIP
-        return NullEnum.NULL
+    # The series group functions are module-level functions, called without a bound class.
+    get_mIP = staticmethod(get_swan_mip_series_group)
+    get_mag = staticmethod(get_swan_phase_series_group)
+    get_swan = staticmethod(get_swan_series_group)
 
     @classmethod
-    def get_mag(cls, dicom_ds: FileDataset) -> Union[SeriesEnum, NullEnum]:
-        """Extract SWANPHASE series group.
-
-        Parameters:
-        dicom_ds : FileDataset
-            The DICOM dataset to process.
+    def get_series_group_fn_list(cls) -> List[Callable]:
+        """Get the list of series group extraction functions.
 
         Returns:
-        Union[SeriesEnum, NullEnum]
-            The SWANPHASE series group or NullEnum.NULL if not found.
+        List[Callable]
+            The list of series group extraction functions.
         """
-        image_type = dicom_ds.get((0x43, 0x102F))
-        if image_type:
-            if image_type.value == SeriesEnum.SWANPHASE.value:
-                return SeriesEnum.SWANPHASE
-
-        return NullEnum.NULL
+        if len(cls.series_group_fn_list) == 0:
+            cls.series_group_fn_list.append(cls.get_swan)
+            cls.series_group_fn_list.append(cls.get_mIP)
+            cls.series_group_fn_list.append(cls.get_mag)
+        return cls.series_group_fn_list
 
     @classmethod
-    def get_swan(cls, dicom_ds: FileDataset) -> Union[SeriesEnum, NullEnum]:
-        """Extract SWAN series group.
+    @functools.lru_cache(maxsize=SERIES_DESCRIPTION_CACHE_SIZE)
+    def match_series_description(cls, series_description: str) -> bool:
+        """Check the series description against the SWAN pattern.
 
         Parameters:
-        dicom_ds : FileDataset
-            The DICOM dataset to process.
+        series_description (str): The series description.
 
         Returns:
-        Union[SeriesEnum, NullEnum]
-            The SWAN series group or NullEnum.NULL if not found.
+        bool: True if the series description matches, cached per series description.
         """
-        pulse_sequence_name = dicom_ds.get((0x19, 0x109c))
-        if pulse_sequence_name:
-            if str(pulse_sequence_name.value).lower() == SeriesEnum.SWAN.value.lower():
-                return SeriesEnum.SWAN
-        return NullEnum.NULL
+        return SWAN_PATTERN.match(series_description) is not None
 
-    @classmethod
-    def get_series_group_fn_list(cls) -> List[Callable]:
-        """Get the list of series group extraction functions.
+    def may_match_series_description(self, series_description: str,
+                                     mr_acquisition_type_enum: Union[MRAcquisitionTypeEnum, NullEnum]) -> bool:
+        """Check the series description against the SWAN pattern.
+
+        Parameters:
+        series_description (str): The series description.
+        mr_acquisition_type_enum (MRAcquisitionTypeEnum): The MR acquisition type.
 
         Returns:
-        List[Callable]
-            The list of series group extraction functions.
+        bool: False if process returns NullEnum.NULL for the series description.
         """
-        if len(cls.series_group_fn_list) == 0:
-            cls.series_group_fn_list.append(cls.get_swan)
-            cls.series_group_fn_list.append(cls.get_mIP)
-            cls.series_group_fn_list.append(cls.get_mag)
-        return cls.series_group_fn_list
+        return self.match_series_description(series_description)
 
-    def process(self, dicom_ds: FileDataset) -> Union[BaseEnum, MRSeriesRenameEnum]:
+    def process(self, dicom_ds: FileDataset,
+                mr_acquisition_type_enum: Union[MRAcquisitionTypeEnum, NullEnum, None] = None) -> \
+            Union[BaseEnum, MRSeriesRenameEnum]:
         """Process a DICOM dataset for SWAN series renaming.
 
         Parameters:
         dicom_ds : FileDataset
             The DICOM dataset to process.
+        mr_acquisition_type_enum : MRAcquisitionTypeEnum, optional
+            The MR acquisition type already read by the caller, not needed by this strategy.
 
         Returns:
         Union[BaseEnum, MRSeriesRenameEnum]
@@ -332,25 +678,18 @@ class SWANProcessingStrategy(MRRenameSeriesProcessingStrategy):
         """
 
         # Extract series description from DICOM dataset
-        series_description = dicom_ds.get((0x08, 0x103E))
-
-        # Iterate through the mapping and check for a match with the series description
-        for series_rename_enum, series_pattern in self.series_rename_mapping.items():
-            match_result = series_pattern.match(series_description.value)
-            if match_result:
-                series_group_set = set()
-                # Extract series groups using additional processing functions
-                for series_group_fn in self.get_series_group_fn_list():
-                    item_enum = series_group_fn(dicom_ds=dicom_ds)
-                    if item_enum is not NullEnum.NULL:
-                        if isinstance(item_enum, tuple):
-                            series_group_set.update(item_enum)
-                        else:
-                            series_group_set.add(item_enum)
-                # Check if the extracted series groups match any defined in series_rename_dict
-                for series_rename_enum, series_rename_group_set in self.series_rename_dict.items():
-                    if series_group_set == series_rename_group_set:
-                        return series_rename_enum
+        series_description = get_data_element(dicom_ds, 0x0008103E)
+
+        # Check the single pattern of series_rename_mapping, matched once per series description
+        if self.match_series_description(series_description.value):
+            series_group_mask = 0
+            # Extract series groups using additional processing functions
+            for series_group_fn in self.get_series_group_fn_list():
+                item_enum = series_group_fn(dicom_ds=dicom_ds)
+                if item_enum is not NullEnum.NULL:
+                    series_group_mask |= get_series_group_mask(self.series_group_bit_dict, item_enum)
+            # Check if the extracted series groups match any defined in series_rename_dict
+            return self.series_rename_lookup.get(series_group_mask, NullEnum.NULL)
 
         # If no match is found, return NullEnum.NULL
         return NullEnum.NULL
@@ -368,10 +707,14 @@ class ESWANProcessingStrategy(MRRenameSeriesProcessingStrategy):
         List of functions to extract series groups for additional processing.
     series_rename_dict : dict
         Mapping of MRSeriesRenameEnum values to sets of SeriesEnum values for grouping.
+    series_rename_lookup : dict
+        The MRSeriesRenameEnum value of the bit mask of each set in series_rename_dict.
     """
 
+    __slots__ = ()
+
     series_rename_mapping = {
-        MRSeriesRenameEnum.eSWAN: re.compile('.*(SWAN).*', re.IGNORECASE),
+        MRSeriesRenameEnum.eSWAN: ESWAN_PATTERN,
     }
     mr_acquisition_type: Tuple[Union[MRAcquisitionTypeEnum, NullEnum]] = (MRAcquisitionTypeEnum.TYPE_3D,)
     series_group_fn_list = []
@@ -380,84 +723,63 @@ class ESWANProcessingStrategy(MRRenameSeriesProcessingStrategy):
         MRSeriesRenameEnum.eSWAN: {SeriesEnum.eSWAN,SeriesEnum.ORIGINAL},
         MRSeriesRenameEnum.eSWANmIP: {SeriesEnum.eSWAN, SeriesEnum.mIP},
     }
+    # Built once from series_rename_dict, the series group is looked up by the bit mask of its enums.
+    series_group_bit_dict = get_series_group_bit_dict(series_rename_dict)
+    series_rename_lookup = get_series_group_mask_lookup(series_group_bit_dict, series_rename_dict)
 
-    @classmethod
-    def get_mIP(cls, dicom_ds: FileDataset) -> Union[SeriesEnum, NullEnum]:
-        """Extract mIP series group.
+    # The series group functions are module-level functions, called without a bound class.
+    get_image_type = staticmethod(get_eswan_image_type_series_group)
+    get_eswan = staticmethod(get_eswan_series_group)
 
-        Parameters:
-        dicom_ds : FileDataset
-            The DICOM dataset to process.
+    @classmethod
+    def get_series_group_fn_list(cls) -> List[Callable]:
+        """Get the list of series group extraction functions.
 
         Returns:
-        Union[SeriesEnum, NullEnum]
-            The mIP series group or NullEnum.NULL if not found.
+        List[Callable]
+            The list of series group extraction functions.
         """
-        image_type = dicom_ds.get((0x08, 0x08))
-        instance_creation_time = dicom_ds.get((0x08, 0x13))
-        if image_type and instance_creation_time is not None:
-            if (image_type.value[-1] == 'MIN IP' or image_type.value[-1] == 'REFORMATTED') and \
-                    instance_creation_time is not None:
-                return SeriesEnum.mIP
-
-        return NullEnum.NULL
+        if len(cls.series_group_fn_list) == 0:
+            cls.series_group_fn_list.append(cls.get_eswan)
+            cls.series_group_fn_list.append(cls.get_image_type)
+        return cls.series_group_fn_list
 
     @classmethod
-    def get_original(cls, dicom_ds: FileDataset) -> Union[SeriesEnum, NullEnum]:
-        """Extract mIP series group.
+    @functools.lru_cache(maxsize=SERIES_DESCRIPTION_CACHE_SIZE)
+    def match_series_description(cls, series_description: str) -> bool:
+        """Check the series description against the eSWAN pattern.
 
         Parameters:
-        dicom_ds : FileDataset
-            The DICOM dataset to process.
+        series_description (str): The series description.
 
         Returns:
-        Union[SeriesEnum, NullEnum]
-            The mIP series group or NullEnum.NULL if not found.
+        bool: True if the series description matches, cached per series description.
         """
-        image_type = dicom_ds.get((0x08, 0x08))
-        if image_type is not None:
-            if image_type.value[0] == 'ORIGINAL':
-                return SeriesEnum.ORIGINAL
-        return NullEnum.NULL
+        return match_keyword_pattern(series_description, 'swan', ESWAN_PATTERN)
 
-    @classmethod
-    def get_eswan(cls, dicom_ds: FileDataset) -> Union[SeriesEnum, NullEnum]:
-        """Extract eSWAN series group.
+    def may_match_series_description(self, series_description: str,
+                                     mr_acquisition_type_enum: Union[MRAcquisitionTypeEnum, NullEnum]) -> bool:
+        """Check the series description against the eSWAN pattern.
 
         Parameters:
-        dicom_ds : FileDataset
-            The DICOM dataset to process.
-
-        Returns:
-        Union[SeriesEnum, NullEnum]
-            The eSWAN series group or NullEnum.NULL if not found.
-        """
-        pulse_sequence_name = dicom_ds.get((0x19, 0x109c))
-        if pulse_sequence_name:
-            if str(pulse_sequence_name.value).lower() == SeriesEnum.eSWAN.value.lower():
-                return SeriesEnum.eSWAN
-        return NullEnum.NULL
-
-    @classmethod
-    def get_series_group_fn_list(cls) -> List[Callable]:
-        """Get the list of series group extraction functions.
+        series_description (str): The series description.
+        mr_acquisition_type_enum (MRAcquisitionTypeEnum): The MR acquisition type.
 
         Returns:
-        List[Callable]
-            The list of series group extraction functions.
+        bool: False if process returns NullEnum.NULL for the series description.
         """
-        if len(cls.series_group_fn_list) == 0:
-            cls.series_group_fn_list.append(cls.get_eswan)
-            cls.series_group_fn_list.append(cls.get_mIP)
-            cls.series_group_fn_list.append(cls.get_original)
-        return cls.series_group_fn_list
+        return self.match_series_description(series_description)
 
-    def process(self, dicom_ds: FileDataset) -> Union[BaseEnum, MRSeriesRenameEnum]:
+    def process(self, dicom_ds: FileDataset,
+                mr_acquisition_type_enum: Union[MRAcquisitionTypeEnum, NullEnum, None] = None) -> \
+            Union[BaseEnum, MRSeriesRenameEnum]:
         """Process a DICOM dataset for eSWAN series renaming.
 
         Parameters:
         dicom_ds : FileDataset
             The DICOM dataset to process.
+        mr_acquisition_type_enum : MRAcquisitionTypeEnum, optional
+            The MR acquisition type already read by the caller, not needed by this strategy.
 
         Returns:
         Union[BaseEnum, MRSeriesRenameEnum]
@@ -465,190 +787,183 @@ class ESWANProcessingStrategy(MRRenameSeriesProcessingStrategy):
         """
 
         # Extract series description from DICOM dataset
-        series_description = dicom_ds.get((0x08, 0x103E))
-
-        # Iterate through the mapping and check for a match with the series description
-        for series_rename_enum, series_pattern in self.series_rename_mapping.items():
-            match_result = series_pattern.match(series_description.value)
-            if match_result:
-                series_group_set = set()
-                # Extract series groups using additional processing functions
-                for series_group_fn in self.get_series_group_fn_list():
-                    item_enum = series_group_fn(dicom_ds=dicom_ds)
-                    if item_enum is not NullEnum.NULL:
-                        if isinstance(item_enum, tuple):
-                            series_group_set.update(item_enum)
-                        else:
-                            series_group_set.add(item_enum)
-                # Check if the extracted series groups match any defined in series_rename_dict
-                for series_rename_enum, series_rename_group_set in self.series_rename_dict.items():
-                    if series_group_set == series_rename_group_set:
-                        return series_rename_enum
+        series_description = get_data_element(dicom_ds, 0x0008103E)
+
+        # Check the single pattern of series_rename_mapping, matched once per series description
+        if self.match_series_description(series_description.value):
+            series_group_mask = 0
+            # Extract series groups using additional processing functions
+            for series_group_fn in self.get_series_group_fn_list():
+                item_enum = series_group_fn(dicom_ds=dicom_ds)
+                if item_enum is not NullEnum.NULL:
+                    series_group_mask |= get_series_group_mask(self.series_group_bit_dict, item_enum)
+            # Check if the extracted series groups match any defined in series_rename_dict
+            return self.series_rename_lookup.get(series_group_mask, NullEnum.NULL)
 
         # If no match is found, return NullEnum.NULL
         return NullEnum.NULL
 
 
-class MRABrainProcessingStrategy(MRRenameSeriesProcessingStrategy):
-    """A processing strategy for MRA Brain series renaming based on DICOM attributes.
+class MRAProcessingStrategy(MRRenameSeriesProcessingStrategy):
+    """A processing strategy for MRA Brain, MRA Neck, MRAVR Brain and MRAVR Neck series in a single pass.
+
+    The series description is read and matched once for all four patterns, and the image type is read at
+    most once. The first matching pattern wins, MRA_BRAIN and MRA_NECK only for an ORIGINAL image type.
+    The per-pattern strategies below are this strategy limited to one pattern.
 
     Attributes:
-    series_rename_mapping : dict
-        Mapping of series descriptions to corresponding regex patterns and MRSeriesRenameEnum values.
+    mra_series_rename_list : tuple
+        The compiled pattern and series enumeration of each MRA pattern, in processing order.
+    original_series_rename_set : frozenset
+        The series enumerations that also require an ORIGINAL image type.
     mr_acquisition_type : tuple
         Tuple containing MR acquisition types and NullEnum, in this case, 3D.
     """
 
-    series_rename_mapping = {
-        MRSeriesRenameEnum.MRA_BRAIN: re.compile('.+(TOF)(((?!Neck).)*)$', re.IGNORECASE),
-    }
+    __slots__ = ()
+
+    mra_series_rename_list = ((MRA_BRAIN_PATTERN, MRSeriesRenameEnum.MRA_BRAIN),
+                              (MRA_NECK_PATTERN, MRSeriesRenameEnum.MRA_NECK),
+                              (MRAVR_BRAIN_PATTERN, MRSeriesRenameEnum.MRAVR_BRAIN),
+                              (MRAVR_NECK_PATTERN, MRSeriesRenameEnum.MRAVR_NECK))
+    original_series_rename_set = frozenset((MRSeriesRenameEnum.MRA_BRAIN, MRSeriesRenameEnum.MRA_NECK))
     mr_acquisition_type: Tuple[Union[MRAcquisitionTypeEnum, NullEnum]] = (MRAcquisitionTypeEnum.TYPE_3D,)
 
-    def process(self, dicom_ds: FileDataset) -> Union[BaseEnum, MRSeriesRenameEnum]:
-        """Process a DICOM dataset for MRA Brain series renaming.
+    @classmethod
+    @functools.lru_cache(maxsize=SERIES_DESCRIPTION_CACHE_SIZE)
+    def get_description_series_rename_tuple(cls, series_description: str) -> Tuple[MRSeriesRenameEnum, ...]:
+        """Get the series enumerations of the MRA strategies whose pattern matches the series description.
 
         Parameters:
-        dicom_ds : FileDataset
-            The DICOM dataset to process.
+        series_description (str): The series description.
 
         Returns:
-        Union[BaseEnum, MRSeriesRenameEnum]
-            The renamed series enumeration or NullEnum.NULL if no match is found.
+        tuple: The matching series enumerations in processing order, cached per series description.
         """
+        return tuple(series_rename_enum for series_pattern, series_rename_enum in cls.mra_series_rename_list
+                     if series_pattern.match(series_description) is not None)
 
-        # Check if modality is MR and acquisition type is 3D
-        series_description = dicom_ds.get((0x08, 0x103E))
-        pattern = self.series_rename_mapping[MRSeriesRenameEnum.MRA_BRAIN]
-        match_result = pattern.match(series_description.value)
+    def may_match_series_description(self, series_description: str,
+                                     mr_acquisition_type_enum: Union[MRAcquisitionTypeEnum, NullEnum]) -> bool:
+        """Check if the series description matches any of the MRA patterns.
 
-        if match_result:
-            image_type_tag = dicom_ds.get((0x08, 0x08))
-            # Check if image type is 'ORIGINAL'
-            if image_type_tag[0] == 'ORIGINAL':
-                return MRSeriesRenameEnum.MRA_BRAIN
+        Parameters:
+        series_description (str): The series description.
+        mr_acquisition_type_enum (MRAcquisitionTypeEnum): The MR acquisition type.
 
-        # If no match or image type is not 'ORIGINAL', return NullEnum.NULL
-        return NullEnum.NULL
+        Returns:
+        bool: False if process returns NullEnum.NULL for the series description.
+        """
+        return len(self.get_description_series_rename_tuple(series_description)) > 0
 
+    def process(self, dicom_ds: FileDataset,
+                mr_acquisition_type_enum: Union[MRAcquisitionTypeEnum, NullEnum, None] = None) -> \
+            Union[BaseEnum, MRSeriesRenameEnum]:
+        """Process a DICOM dataset for MRA series renaming.
 
-class MRANeckProcessingStrategy(MRRenameSeriesProcessingStrategy):
-    """A processing strategy for MRA Neck series renaming based on DICOM attributes.
+        Parameters:
+        dicom_ds (FileDataset): The DICOM dataset.
+        mr_acquisition_type_enum (MRAcquisitionTypeEnum): The MR acquisition type already read by the caller, not
+            needed by this strategy.
 
-    Attributes:
-    series_rename_mapping : dict
-        Mapping of series descriptions to corresponding regex patterns and MRSeriesRenameEnum values.
-    mr_acquisition_type : tuple
-        Tuple containing MR acquisition types and NullEnum, in this case, 3D.
-    """
-
-    series_rename_mapping = {
-        MRSeriesRenameEnum.MRA_NECK: re.compile('.*(TOF).*((Neck+).*)$', re.IGNORECASE),
-    }
-    mr_acquisition_type: Tuple[Union[MRAcquisitionTypeEnum, NullEnum]] = (MRAcquisitionTypeEnum.TYPE_3D,)
+        Returns:
+        Union[BaseEnum, MRSeriesRenameEnum]: The renamed series enumeration or NullEnum.NULL if no match is found.
+        """
+        series_description = get_data_element(dicom_ds, 0x0008103E)
+        return self.get_series_rename_enum(dicom_ds,
+                                           self.get_description_series_rename_tuple(series_description.value))
 
-    def process(self, dicom_ds: FileDataset) -> Union[BaseEnum, MRSeriesRenameEnum]:
-        """Process a DICOM dataset for MRA Neck series renaming.
+    def batch_process(self, dicom_ds_list: List[FileDataset],
+                      mr_acquisition_type_enum_list: Union[List[BaseEnum], None] = None) -> \
+            List[Union[BaseEnum, MRSeriesRenameEnum]]:
+        """Process a batch of DICOM datasets, matching each distinct series description once.
 
         Parameters:
-        dicom_ds : FileDataset
-            The DICOM dataset to process.
+        dicom_ds_list (List[FileDataset]): The DICOM datasets.
+        mr_acquisition_type_enum_list (list): The MR acquisition type of each dataset, not needed by this
+            strategy.
 
         Returns:
-        Union[BaseEnum, MRSeriesRenameEnum]
-            The renamed series enumeration or NullEnum.NULL if no match is found.
+        List[Union[BaseEnum, MRSeriesRenameEnum]]: The same result as process for each dataset, in order.
         """
+        series_description_list = [get_data_element(dicom_ds, 0x0008103E).value for dicom_ds in dicom_ds_list]
+        series_rename_tuple_dict = {series_description: self.get_description_series_rename_tuple(series_description)
+                                    for series_description in set(series_description_list)}
+        return [self.get_series_rename_enum(dicom_ds, series_rename_tuple_dict[series_description])
+                for dicom_ds, series_description in zip(dicom_ds_list, series_description_list)]
 
-        # Check if modality is MR and acquisition type is 3D
-        series_description = dicom_ds.get((0x08, 0x103E))
-        pattern = self.series_rename_mapping[MRSeriesRenameEnum.MRA_NECK]
-        match_result = pattern.match(series_description.value)
+    def get_series_rename_enum(self, dicom_ds: FileDataset, series_rename_tuple: Tuple[MRSeriesRenameEnum, ...]) -> \
+            Union[BaseEnum, MRSeriesRenameEnum]:
+        """Get the first matching series enumeration whose image type requirement the dataset meets.
 
-        if match_result:
-            image_type_tag = dicom_ds.get((0x08, 0x08))
-            # Check if image type is 'ORIGINAL'
-            if image_type_tag[0] == 'ORIGINAL':
-                return MRSeriesRenameEnum.MRA_NECK
+        Parameters:
+        dicom_ds (FileDataset): The DICOM dataset.
+        series_rename_tuple (tuple): The result of get_description_series_rename_tuple for its series description.
 
-        # If no match or image type is not 'ORIGINAL', return NullEnum.NULL
+        Returns:
+        Union[BaseEnum, MRSeriesRenameEnum]: The renamed series enumeration or NullEnum.NULL if no match is found.
+        """
+        original_image_type = None
+        for series_rename_enum in series_rename_tuple:
+            if series_rename_enum in self.original_series_rename_set:
+                if original_image_type is None:
+                    original_image_type = is_original_image_type(dicom_ds)
+                if not original_image_type:
+                    continue
+            return series_rename_enum
         return NullEnum.NULL
 
 
-class MRAVRBrainProcessingStrategy(MRRenameSeriesProcessingStrategy):
-    """A processing strategy for MRAVR Brain series renaming based on DICOM attributes.
+class MRABrainProcessingStrategy(MRAProcessingStrategy):
+    """A processing strategy for MRA Brain series renaming, the MRA strategy limited to the MRA_BRAIN pattern.
 
     Attributes:
-    series_rename_mapping : dict
-        Mapping of series descriptions to corresponding regex patterns and MRSeriesRenameEnum values.
-    mr_acquisition_type : tuple
-        Tuple containing MR acquisition types and NullEnum, in this case, 3D.
+    mra_series_rename_list : tuple
+        The compiled MRA_BRAIN pattern and its series enumeration.
     """
 
-    series_rename_mapping = {
-        MRSeriesRenameEnum.MRAVR_BRAIN: re.compile('((?!TOF|Neck).)*(MRA)((?!Neck).)*$', re.IGNORECASE),
-    }
-    mr_acquisition_type: Tuple[Union[MRAcquisitionTypeEnum, NullEnum]] = (MRAcquisitionTypeEnum.TYPE_3D,)
+    __slots__ = ()
 
-    def process(self, dicom_ds: FileDataset) -> Union[BaseEnum, MRSeriesRenameEnum]:
-        """Process a DICOM dataset for MRAVR Brain series renaming.
+    mra_series_rename_list = ((MRA_BRAIN_PATTERN, MRSeriesRenameEnum.MRA_BRAIN),)
 
-        Parameters:
-        dicom_ds : FileDataset
-            The DICOM dataset to process.
 
-        Returns:
-        Union[BaseEnum, MRSeriesRenameEnum]
-            The renamed series enumeration or NullEnum.NULL if no match is found.
-        """
+class MRANeckProcessingStrategy(MRAProcessingStrategy):
+    """A processing strategy for MRA Neck series renaming, the MRA strategy limited to the MRA_NECK pattern.
 
-        # Check if modality is MR and acquisition type is 3D
-        series_description = dicom_ds.get((0x08, 0x103E))
-        pattern = self.series_rename_mapping[MRSeriesRenameEnum.MRAVR_BRAIN]
-        match_result = pattern.match(series_description.value)
+    Attributes:
+    mra_series_rename_list : tuple
+        The compiled MRA_NECK pattern and its series enumeration.
+    """
 
-        if match_result:
-            return MRSeriesRenameEnum.MRAVR_BRAIN
+    __slots__ = ()
 
-        # If no match, return NullEnum.NULL
-        return NullEnum.NULL
+    mra_series_rename_list = ((MRA_NECK_PATTERN, MRSeriesRenameEnum.MRA_NECK),)
 
 
-class MRAVRNeckProcessingStrategy(MRRenameSeriesProcessingStrategy):
-    """A processing strategy for MRAVR Neck series renaming based on DICOM attributes.
+class MRAVRBrainProcessingStrategy(MRAProcessingStrategy):
+    """A processing strategy for MRAVR Brain series renaming, the MRA strategy limited to the MRAVR_BRAIN pattern.
 
     Attributes:
-    series_rename_mapping : dict
-        Mapping of series descriptions to corresponding regex patterns and MRSeriesRenameEnum values.
-    mr_acquisition_type : tuple
-        Tuple containing MR acquisition types and NullEnum, in this case, 3D.
+    mra_series_rename_list : tuple
+        The compiled MRAVR_BRAIN pattern and its series enumeration.
     """
 
-    series_rename_mapping = {
-        MRSeriesRenameEnum.MRAVR_NECK: re.compile('((?!TOF).)*(Neck.*MRA)|(MRA.*Neck).*$', re.IGNORECASE),
-    }
-    mr_acquisition_type: Tuple[Union[MRAcquisitionTypeEnum, NullEnum]] = (MRAcquisitionTypeEnum.TYPE_3D,)
+    __slots__ = ()
 
-    def process(self, dicom_ds: FileDataset) -> Union[BaseEnum, MRSeriesRenameEnum]:
-        """Process a DICOM dataset for MRAVR Neck series renaming.
+    mra_series_rename_list = ((MRAVR_BRAIN_PATTERN, MRSeriesRenameEnum.MRAVR_BRAIN),)
 
-        Parameters:
-        dicom_ds : FileDataset
-            The DICOM dataset to process.
 
-        Returns:
-        Union[BaseEnum, MRSeriesRenameEnum]
-            The renamed series enumeration or NullEnum.NULL if no match is found.
-        """
+class MRAVRNeckProcessingStrategy(MRAProcessingStrategy):
+    """A processing strategy for MRAVR Neck series renaming, the MRA strategy limited to the MRAVR_NECK pattern.
 
-        # Check if modality is MR and acquisition type is 3D
-        series_description = dicom_ds.get((0x08, 0x103E))
-        pattern = self.series_rename_mapping[MRSeriesRenameEnum.MRAVR_NECK]
-        match_result = pattern.match(series_description.value)
+    Attributes:
+    mra_series_rename_list : tuple
+        The compiled MRAVR_NECK pattern and its series enumeration.
+    """
 
-        if match_result:
-            return MRSeriesRenameEnum.MRAVR_NECK
+    __slots__ = ()
 
-        # If no match, return NullEnum.NULL
-        return NullEnum.NULL
+    mra_series_rename_list = ((MRAVR_NECK_PATTERN, MRSeriesRenameEnum.MRAVR_NECK),)
 
 
 class T1ProcessingStrategy(MRRenameSeriesProcessingStrategy):
@@ -675,17 +990,19 @@ class T1ProcessingStrategy(MRRenameSeriesProcessingStrategy):
         List containing functions for extracting series group information.
     """
 
+    __slots__ = ()
+
     series_rename_mapping = {
         T1SeriesRenameEnum.T1: re.compile('.*(T1|AX|COR|SAG).*', re.IGNORECASE),
-        SeriesEnum.FLAIR: re.compile('(FLAIR)', re.IGNORECASE),
-        SeriesEnum.CUBE: re.compile('.*(CUBE).*', re.IGNORECASE),
+        SeriesEnum.FLAIR: FLAIR_PATTERN,
+        SeriesEnum.CUBE: CUBE_PATTERN,
         SeriesEnum.BRAVO: re.compile('.*(BRAVO|FSPGR).*', re.IGNORECASE),
     }
     type_3D_series_rename_mapping = series_rename_mapping
 
     type_2D_series_rename_mapping = {
         T1SeriesRenameEnum.T1: re.compile('.*(T1).*', re.IGNORECASE),
-        SeriesEnum.FLAIR: re.compile('(FLAIR)', re.IGNORECASE),
+        SeriesEnum.FLAIR: FLAIR_PATTERN,
     }
 
     type_2D_series_rename_dict = {
@@ -802,8 +1119,24 @@ class T1ProcessingStrategy(MRRenameSeriesProcessingStrategy):
     mr_acquisition_type: Tuple[Union[MRAcquisitionTypeEnum, NullEnum]] = (MRAcquisitionTypeEnum.TYPE_3D,
                                                                           MRAcquisitionTypeEnum.TYPE_2D,
                                                                           )
-    image_orientation_processing_strategy = ImageOrientationProcessingStrategy()
+    image_orientation_processing_strategy = IMAGE_ORIENTATION_PROCESSING_STRATEGY
     contrast_processing_strategy = ContrastProcessingStrategy()
+    type_process_dict = {
+        MRAcquisitionTypeEnum.TYPE_2D: (type_2D_series_rename_mapping,
+                                        get_series_rename_matcher(type_2D_series_rename_mapping),
+                                        get_series_rename_lookup(type_2D_series_rename_dict)),
+        MRAcquisitionTypeEnum.TYPE_3D: (type_3D_series_rename_mapping,
+                                        get_series_rename_matcher(type_3D_series_rename_mapping),
+                                        get_series_rename_lookup(type_3D_series_rename_dict)),
+    }
+    # Lowercased once here instead of on every dataset.
+    cube_pulse_sequence_name = SeriesEnum.CUBE.value.lower()
+    bravo_pulse_sequence_name_set = frozenset((SeriesEnum.BRAVO.value.lower(), SeriesEnum.FSPGR.value.lower()))
+    # The series group of each lowercase pulse sequence name, CUBE or BRAVO.
+    pulse_sequence_series_group_dict = {
+        cube_pulse_sequence_name: SeriesEnum.CUBE,
+        **dict.fromkeys(bravo_pulse_sequence_name_set, (T1SeriesRenameEnum.T1, SeriesEnum.BRAVO)),
+    }
     series_group_fn_list = []
 
     @classmethod
@@ -817,34 +1150,10 @@ class T1ProcessingStrategy(MRRenameSeriesProcessingStrategy):
             cls.series_group_fn_list.append(cls.get_image_orientation)
             cls.series_group_fn_list.append(cls.get_contrast)
             cls.series_group_fn_list.append(cls.get_flair)
-            cls.series_group_fn_list.append(cls.get_cube)
-            cls.series_group_fn_list.append(cls.get_bravo)
+            cls.series_group_fn_list.append(cls.get_pulse_sequence)
         return cls.series_group_fn_list
 
-    @classmethod
-    def get_image_orientation(cls, dicom_ds: FileDataset):
-        """Get the image orientation information from the DICOM dataset.
-
-        Parameters:
-        dicom_ds (FileDataset): The DICOM dataset.
-
-        Returns:
-        Union[BaseEnum, ImageOrientationEnum]: Image orientation information.
-        """
-        # (0008,0008)	Image Type	DERIVED\SECONDARY\REFORMATTED
-        image_orientation = cls.image_orientation_processing_strategy.process(dicom_ds=dicom_ds)
-        image_type = dicom_ds.get((0x08, 0x08))
-        if image_type[2] == 'REFORMATTED':
-            if image_orientation == ImageOrientationEnum.AXI:
-                return ImageOrientationEnum.AXIr
-            elif image_orientation == ImageOrientationEnum.SAG:
-                return ImageOrientationEnum.SAGr
-            elif image_orientation == ImageOrientationEnum.COR:
-                return ImageOrientationEnum.CORr
-            else:
-                return image_orientation
-        else:
-            return image_orientation
+    get_image_orientation = staticmethod(get_image_orientation_series_group)
 
     @classmethod
     def get_contrast(cls, dicom_ds: FileDataset):
@@ -869,8 +1178,8 @@ class T1ProcessingStrategy(MRRenameSeriesProcessingStrategy):
         Returns:
         Union[BaseEnum, T1SeriesRenameEnum, SeriesEnum]: FLAIR series information.
         """
-        tr = float(dicom_ds[0x18, 0x80].value)
-        te = float(dicom_ds[0x18, 0x81].value)
+        tr = float(get_required_data_element(dicom_ds, 0x00180080).value)
+        te = float(get_required_data_element(dicom_ds, 0x00180081).value)
         if 800 <= tr <= 3000 and te <= 30:
             return T1SeriesRenameEnum.T1, SeriesEnum.FLAIR
         if tr <= 800 and te <= 30:
@@ -878,84 +1187,61 @@ class T1ProcessingStrategy(MRRenameSeriesProcessingStrategy):
         return NullEnum.NULL
 
     @classmethod
-    def get_cube(cls, dicom_ds: FileDataset, ):
-        """Get series information for CUBE sequences from the DICOM dataset.
-
-        Parameters:
-        dicom_ds (FileDataset): The DICOM dataset.
-
-        Returns:
-        Union[BaseEnum, SeriesEnum]: CUBE series information.
-        """
-        pulse_sequence_name = dicom_ds.get((0x19, 0x109c))
-        if pulse_sequence_name:
-            if str(pulse_sequence_name.value).lower() == SeriesEnum.CUBE.value.lower():
-                return SeriesEnum.CUBE
-        return NullEnum.NULL
-
-    @classmethod
-    def get_bravo(cls, dicom_ds: FileDataset, ):
-        """Get series information for BRAVO sequences from the DICOM dataset.
+    def get_pulse_sequence(cls, dicom_ds: FileDataset):
+        """Get the CUBE or BRAVO series information from the pulse sequence name, read and lowercased once.
 
         Parameters:
         dicom_ds (FileDataset): The DICOM dataset.
 
         Returns:
-        Union[BaseEnum, T1SeriesRenameEnum, SeriesEnum]: BRAVO series information.
+        Union[BaseEnum, T1SeriesRenameEnum, SeriesEnum]: CUBE or BRAVO series information.
         """
-        pulse_sequence_name = dicom_ds.get((0x19, 0x109c))
+        pulse_sequence_name = get_data_element(dicom_ds, 0x0019109C)
         if pulse_sequence_name:
-            pulse_sequence_name_str = str(pulse_sequence_name.value).lower()
-            if (
-                    pulse_sequence_name_str == SeriesEnum.BRAVO.value.lower()) or pulse_sequence_name_str == SeriesEnum.FSPGR.value.lower():
-                return T1SeriesRenameEnum.T1, SeriesEnum.BRAVO
+            return cls.pulse_sequence_series_group_dict.get(str(pulse_sequence_name.value).lower(), NullEnum.NULL)
         return NullEnum.NULL
 
-    def type_process(self, dicom_ds: FileDataset, type_series_rename_mapping, type_series_rename_dict) -> Union[
-        BaseEnum, MRSeriesRenameEnum]:
+    def type_process(self, dicom_ds: FileDataset, type_series_rename_mapping, type_series_rename_matcher,
+                     type_series_rename_lookup) -> Union[BaseEnum, MRSeriesRenameEnum]:
         """Process the DICOM dataset for T1 series renaming based on acquisition type.
 
         Parameters:
         dicom_ds (FileDataset): The DICOM dataset.
         type_series_rename_mapping (dict): Mapping of series descriptions to corresponding regex patterns for the acquisition type.
-        type_series_rename_dict (dict): Mapping of T1SeriesRenameEnum values to sets of attributes for the acquisition type.
+        type_series_rename_matcher (re.Pattern): The patterns of type_series_rename_mapping as one alternation.
+        type_series_rename_lookup (dict): The T1SeriesRenameEnum value of each attribute set, as a frozenset, for the acquisition type.
 
         Returns:
         Union[BaseEnum, MRSeriesRenameEnum]: The renamed series enumeration or NullEnum.NULL if no match is found.
         """
-        series_description = dicom_ds.get((0x08, 0x103E))
-        for series_rename_enum, series_pattern in type_series_rename_mapping.items():
-            match_result = series_pattern.match(series_description.value)
-            if match_result:
-                series_group_set = set()
-                for series_group_fn in self.get_series_group_fn_list():
-                    item_enum = series_group_fn(dicom_ds=dicom_ds)
-                    if item_enum is not NullEnum.NULL:
-                        if isinstance(item_enum, tuple):
-                            series_group_set.update(item_enum)
-                        else:
-                            series_group_set.add(item_enum)
-                for series_rename_enum, series_rename_group_set in type_series_rename_dict.items():
-                    if series_group_set == series_rename_group_set:
-                        return series_rename_enum
-
+        series_description = get_data_element(dicom_ds, 0x0008103E)
+        # The series group does not depend on which pattern matched, so one match of the alternation decides.
+        if match_series_rename_matcher(type_series_rename_matcher, series_description.value):
+            series_group_set = set()
+            for series_group_fn in self.get_series_group_fn_list():
+                item_enum = series_group_fn(dicom_ds=dicom_ds)
+                if item_enum is not NullEnum.NULL:
+                    if isinstance(item_enum, tuple):
+                        series_group_set.update(item_enum)
+                    else:
+                        series_group_set.add(item_enum)
+            return type_series_rename_lookup.get(frozenset(series_group_set), NullEnum.NULL)
         return NullEnum.NULL
 
-    def process(self, dicom_ds: FileDataset) -> Union[BaseEnum, MRSeriesRenameEnum]:
+    def process(self, dicom_ds: FileDataset,
+                mr_acquisition_type_enum: Union[MRAcquisitionTypeEnum, NullEnum, None] = None) -> \
+            Union[BaseEnum, MRSeriesRenameEnum]:
         """Process the DICOM dataset for T1 series renaming.
 
         Parameters:
         dicom_ds (FileDataset): The DICOM dataset.
+        mr_acquisition_type_enum (MRAcquisitionTypeEnum): The MR acquisition type already read by the caller, read
+            from the dataset when None.
 
         Returns:
         Union[BaseEnum, MRSeriesRenameEnum]: The renamed series enumeration or NullEnum.NULL if no match is found.
         """
-        mr_acquisition_type_enum = self.mr_acquisition_type_processing_strategy.process(dicom_ds=dicom_ds)
-        if mr_acquisition_type_enum == MRAcquisitionTypeEnum.TYPE_2D:
-            return self.type_process(dicom_ds, self.type_2D_series_rename_mapping, self.type_2D_series_rename_dict)
-        if mr_acquisition_type_enum == MRAcquisitionTypeEnum.TYPE_3D:
-            return self.type_process(dicom_ds, self.type_3D_series_rename_mapping, self.type_3D_series_rename_dict)
-        return NullEnum.NULL
+        return self.dispatch_type_process(dicom_ds, mr_acquisition_type_enum)
 
 
 class T2ProcessingStrategy(MRRenameSeriesProcessingStrategy):
@@ -982,16 +1268,18 @@ class T2ProcessingStrategy(MRRenameSeriesProcessingStrategy):
         List containing functions for extracting series group information.
     """
 
+    __slots__ = ()
+
     series_rename_mapping = {
-        T2SeriesRenameEnum.T2: re.compile('.*(T2).*', re.IGNORECASE),
-        SeriesEnum.FLAIR: re.compile('(FLAIR)', re.IGNORECASE),
-        SeriesEnum.CUBE: re.compile('.*(CUBE).*', re.IGNORECASE),
+        T2SeriesRenameEnum.T2: T2_PATTERN,
+        SeriesEnum.FLAIR: FLAIR_PATTERN,
+        SeriesEnum.CUBE: CUBE_PATTERN,
     }
     type_3D_series_rename_mapping = series_rename_mapping
 
     type_2D_series_rename_mapping = {
-        T2SeriesRenameEnum.T2: re.compile('.*(T2).*', re.IGNORECASE),
-        SeriesEnum.FLAIR: re.compile('(FLAIR)', re.IGNORECASE),
+        T2SeriesRenameEnum.T2: T2_PATTERN,
+        SeriesEnum.FLAIR: FLAIR_PATTERN,
     }
 
     type_2D_series_rename_dict = {
@@ -1083,8 +1371,18 @@ class T2ProcessingStrategy(MRRenameSeriesProcessingStrategy):
         MRAcquisitionTypeEnum.TYPE_3D,
         MRAcquisitionTypeEnum.TYPE_2D,
     )
-    image_orientation_processing_strategy = ImageOrientationProcessingStrategy()
+    image_orientation_processing_strategy = IMAGE_ORIENTATION_PROCESSING_STRATEGY
     contrast_processing_strategy = ContrastProcessingStrategy()
+    type_process_dict = {
+        MRAcquisitionTypeEnum.TYPE_2D: (type_2D_series_rename_mapping,
+                                        get_series_rename_matcher(type_2D_series_rename_mapping),
+                                        get_series_rename_lookup(type_2D_series_rename_dict)),
+        MRAcquisitionTypeEnum.TYPE_3D: (type_3D_series_rename_mapping,
+                                        get_series_rename_matcher(type_3D_series_rename_mapping),
+                                        get_series_rename_lookup(type_3D_series_rename_dict)),
+    }
+    # Lowercased once here instead of on every dataset.
+    cube_pulse_sequence_name = SeriesEnum.CUBE.value.lower()
     series_group_fn_list = []
 
     @classmethod
@@ -1101,30 +1399,7 @@ class T2ProcessingStrategy(MRRenameSeriesProcessingStrategy):
             cls.series_group_fn_list.append(cls.get_cube)
         return cls.series_group_fn_list
 
-    @classmethod
-    def get_image_orientation(cls, dicom_ds: FileDataset):
-        """Get the image orientation information from the DICOM dataset.
-
-        Parameters:
-        dicom_ds (FileDataset): The DICOM dataset.
-
-        Returns:
-        Union[BaseEnum, ImageOrientationEnum]: Image orientation information.
-        """
-        # (0008,0008)	Image Type	DERIVED\SECONDARY\REFORMATTED
-        image_orientation = cls.image_orientation_processing_strategy.process(dicom_ds=dicom_ds)
-        image_type = dicom_ds.get((0x08, 0x08))
-        if image_type[2] == 'REFORMATTED':
-            if image_orientation == ImageOrientationEnum.AXI:
-                return ImageOrientationEnum.AXIr
-            elif image_orientation == ImageOrientationEnum.SAG:
-                return ImageOrientationEnum.SAGr
-            elif image_orientation == ImageOrientationEnum.COR:
-                return ImageOrientationEnum.CORr
-            else:
-                return image_orientation
-        else:
-            return image_orientation
+    get_image_orientation = staticmethod(get_image_orientation_series_group)
 
     @classmethod
     def get_contrast(cls, dicom_ds: FileDataset):
@@ -1150,9 +1425,9 @@ class T2ProcessingStrategy(MRRenameSeriesProcessingStrategy):
         Union[BaseEnum, T2SeriesRenameEnum, SeriesEnum]: FLAIR series information.
         """
         # tr = float(dicom_ds[0x18, 0x80].value)
-        te = float(dicom_ds[0x18, 0x81].value)
+        te = float(get_required_data_element(dicom_ds, 0x00180081).value)
         # (0018,0082)	Inversion Time	2500
-        ti = dicom_ds.get((0x18, 0x82))
+        ti = get_data_element(dicom_ds, 0x00180082)
         if te >= 80 and ti is not None:
             return T2SeriesRenameEnum.T2, SeriesEnum.FLAIR
         if te >= 80 and ti is None:
@@ -1175,57 +1450,53 @@ class T2ProcessingStrategy(MRRenameSeriesProcessingStrategy):
         Returns:
         Union[BaseEnum, SeriesEnum]: CUBE series information.
         """
-        pulse_sequence_name = dicom_ds.get((0x19, 0x109c))
+        pulse_sequence_name = get_data_element(dicom_ds, 0x0019109C)
         if pulse_sequence_name:
-            if SeriesEnum.CUBE.value.lower() in str(pulse_sequence_name.value).lower():
+            if cls.cube_pulse_sequence_name in str(pulse_sequence_name.value).lower():
                 return SeriesEnum.CUBE
         return NullEnum.NULL
 
-    def type_process(self, dicom_ds: FileDataset, type_series_rename_mapping, type_series_rename_dict) -> Union[
-        BaseEnum, MRSeriesRenameEnum]:
+    def type_process(self, dicom_ds: FileDataset, type_series_rename_mapping, type_series_rename_matcher,
+                     type_series_rename_lookup) -> Union[BaseEnum, MRSeriesRenameEnum]:
         """Process the DICOM dataset for T2 series renaming based on acquisition type.
 
         Parameters:
         dicom_ds (FileDataset): The DICOM dataset.
         type_series_rename_mapping (dict): Mapping of series descriptions to corresponding regex patterns for the acquisition type.
-        type_series_rename_dict (dict): Mapping of T2SeriesRenameEnum values to sets of attributes for the acquisition type.
+        type_series_rename_matcher (re.Pattern): The patterns of type_series_rename_mapping as one alternation.
+        type_series_rename_lookup (dict): The T2SeriesRenameEnum value of each attribute set, as a frozenset, for the acquisition type.
 
         Returns:
         Union[BaseEnum, MRSeriesRenameEnum]: The renamed series enumeration or NullEnum.NULL if no match is found.
         """
-        series_description = dicom_ds.get((0x08, 0x103E))
-        for series_rename_enum, series_pattern in type_series_rename_mapping.items():
-            match_result = series_pattern.match(series_description.value)
-            if match_result:
-                series_group_set = set()
-                for series_group_fn in self.get_series_group_fn_list():
-                    item_enum = series_group_fn(dicom_ds=dicom_ds)
-                    if item_enum is not NullEnum.NULL:
-                        if isinstance(item_enum, tuple):
-                            series_group_set.update(item_enum)
-                        else:
-                            series_group_set.add(item_enum)
-                for series_rename_enum, series_rename_group_set in type_series_rename_dict.items():
-                    if series_group_set == series_rename_group_set:
-                        return series_rename_enum
-
+        series_description = get_data_element(dicom_ds, 0x0008103E)
+        # The series group does not depend on which pattern matched, so one match of the alternation decides.
+        if match_series_rename_matcher(type_series_rename_matcher, series_description.value):
+            series_group_set = set()
+            for series_group_fn in self.get_series_group_fn_list():
+                item_enum = series_group_fn(dicom_ds=dicom_ds)
+                if item_enum is not NullEnum.NULL:
+                    if isinstance(item_enum, tuple):
+                        series_group_set.update(item_enum)
+                    else:
+                        series_group_set.add(item_enum)
+            return type_series_rename_lookup.get(frozenset(series_group_set), NullEnum.NULL)
         return NullEnum.NULL
 
-    def process(self, dicom_ds: FileDataset) -> Union[BaseEnum, MRSeriesRenameEnum]:
+    def process(self, dicom_ds: FileDataset,
+                mr_acquisition_type_enum: Union[MRAcquisitionTypeEnum, NullEnum, None] = None) -> \
+            Union[BaseEnum, MRSeriesRenameEnum]:
         """Process the DICOM dataset for T2 series renaming.
 
         Parameters:
         dicom_ds (FileDataset): The DICOM dataset.
+        mr_acquisition_type_enum (MRAcquisitionTypeEnum): The MR acquisition type already read by the caller, read
+            from the dataset when None.
 
         Returns:
         Union[BaseEnum, MRSeriesRenameEnum]: The renamed series enumeration or NullEnum.NULL if no match is found.
         """
-        mr_acquisition_type_enum = self.mr_acquisition_type_processing_strategy.process(dicom_ds=dicom_ds)
-        if mr_acquisition_type_enum == MRAcquisitionTypeEnum.TYPE_2D:
-            return self.type_process(dicom_ds, self.type_2D_series_rename_mapping, self.type_2D_series_rename_dict)
-        if mr_acquisition_type_enum == MRAcquisitionTypeEnum.TYPE_3D:
-            return self.type_process(dicom_ds, self.type_3D_series_rename_mapping, self.type_3D_series_rename_dict)
-        return NullEnum.NULL
+        return self.dispatch_type_process(dicom_ds, mr_acquisition_type_enum)
 
 
 class ASLProcessingStrategy(MRRenameSeriesProcessingStrategy):
@@ -1244,6 +1515,8 @@ class ASLProcessingStrategy(MRRenameSeriesProcessingStrategy):
         List containing functions for extracting series group information.
     """
 
+    __slots__ = ()
+
     # multi-Delay ASL SEQ  TDelay_SEQ
     # ASLSEQSeriesRenameEnum.ASLSEQATT: re.compile('([(]Transit delay[)] multi-Delay ASL SEQ)', re.IGNORECASE),
     # ASLSEQSeriesRenameEnum.ASLSEQATT: re.compile('([(]Transit delay[)]) (multi-Delay ASL SEQ|TDelay_SEQ)',
@@ -1307,7 +1580,19 @@ class ASLProcessingStrategy(MRRenameSeriesProcessingStrategy):
     }
 
     mr_acquisition_type: Tuple[Union[MRAcquisitionTypeEnum, NullEnum]] = (MRAcquisitionTypeEnum.TYPE_3D,NullEnum.NULL)
+    type_process_dict = {
+        MRAcquisitionTypeEnum.TYPE_3D: (type_3D_series_rename_mapping,
+                                        get_series_rename_matcher(type_3D_series_rename_mapping),
+                                        get_series_rename_lookup(type_3D_series_rename_dict)),
+        NullEnum.NULL: (type_null_series_rename_mapping,
+                        get_series_rename_matcher(type_null_series_rename_mapping),
+                        get_series_rename_lookup(type_null_series_rename_dict)),
+    }
     series_group_fn_list = []
+    # The series group functions are module-level functions, called without a bound class.
+    get_asl = staticmethod(get_asl_series_group)
+    get_cbf = staticmethod(get_asl_cbf_series_group)
+    get_conversion_type = staticmethod(get_color_series_group)
 
     @classmethod
     def get_series_group_fn_list(cls):
@@ -1322,68 +1607,26 @@ class ASLProcessingStrategy(MRRenameSeriesProcessingStrategy):
             cls.series_group_fn_list.append(cls.get_cbf)
         return cls.series_group_fn_list
 
-
-    @classmethod
-    def get_asl(cls, dicom_ds: FileDataset, ):
-        # (0019,109C)	Unknown  Tag &  Data	ASL
-        pulse_sequence_name = dicom_ds.get((0x19, 0x109c))
-        if pulse_sequence_name:
-            # SIGNA Voyager (0019,109C)	Unknown  Tag &  Data	ASL
-            if str(pulse_sequence_name.value).lower() == ASLSEQSeriesRenameEnum.ASL.value.lower():
-                return ASLSEQSeriesRenameEnum.ASL
-        else:
-            # MR360 (0008,103E)	Series Description	SCREENSAVE
-            # (0043,10A4)	Unknown  Tag &  Data	3D pulsed continuous ASL technique
-            ASL_technique = dicom_ds.get((0x43, 0x10A4))
-            if ASL_technique:
-                if ASLSEQSeriesRenameEnum.ASL.value.lower() in str(ASL_technique.value).lower():
-                    return ASLSEQSeriesRenameEnum.ASL
-        return NullEnum.NULL
-
-    @classmethod
-    def get_cbf(cls, dicom_ds: FileDataset, ):
-        functional_processing_name = dicom_ds.get((0x51, 0x1002))
-        if functional_processing_name:
-            if str(functional_processing_name.value).lower() == ASLSEQSeriesRenameEnum.CBF.value.lower():
-                return ASLSEQSeriesRenameEnum.CBF
-            elif str(functional_processing_name.value).lower() == ASLSEQSeriesRenameEnum.Cerebral_Blood_Flow.value.lower():
-                return ASLSEQSeriesRenameEnum.CBF
-        else:
-            # (0008,1090)	Manufacturer Model Name	MR360
-            manufacturer_model_name = dicom_ds.get((0x08, 0x1090))
-            image_type_tag = dicom_ds.get((0x08, 0x08))
-            # (0008,0008)	Image Type	DERIVED\SECONDARY\SCREEN SAVE
-            # ASLSEQSeriesRenameEnum.ASLPRODCBF_COLOR get CBF
-            if 'MR360' in manufacturer_model_name.value and image_type_tag[-1] == 'SCREEN SAVE':
-                    return ASLSEQSeriesRenameEnum.CBF
-        return NullEnum.NULL
-
-    @classmethod
-    def get_conversion_type(cls, dicom_ds: FileDataset, ):
-        # (0008,0064)	Conversion Type	WSD
-        conversion_type = dicom_ds.get((0x08, 0x64))
-        if conversion_type:
-            return ASLSEQSeriesRenameEnum.COLOR
-        return NullEnum.NULL
-
-    def type_process(self, dicom_ds: FileDataset, type_series_rename_mapping, type_series_rename_dict) -> Union[
-        BaseEnum, MRSeriesRenameEnum]:
+    def type_process(self, dicom_ds: FileDataset, type_series_rename_mapping, type_series_rename_matcher,
+                     type_series_rename_lookup) -> Union[BaseEnum, MRSeriesRenameEnum]:
         """Process the DICOM dataset for ASL series renaming based on acquisition type.
 
         Parameters:
         dicom_ds (FileDataset): The DICOM dataset.
         type_series_rename_mapping (dict): Mapping of series descriptions to corresponding regex patterns for the acquisition type.
-        type_series_rename_dict (dict): Mapping of ASLSEQSeriesRenameEnum values to sets of attributes for the acquisition type.
+        type_series_rename_matcher (re.Pattern): The patterns of type_series_rename_mapping as one alternation.
+        type_series_rename_lookup (dict): The ASLSEQSeriesRenameEnum value of each attribute set, as a frozenset, for the acquisition type.
 
         Returns:
         Union[BaseEnum, MRSeriesRenameEnum]: The renamed series enumeration or NullEnum.NULL if no match is found.
         """
-        series_description = dicom_ds.get((0x08, 0x103E))
-        for series_rename_enum, series_pattern in type_series_rename_mapping.items():
-            match_result = series_pattern.match(series_description.value)
-            if match_result:
+        series_description = get_data_element(dicom_ds, 0x0008103E)
+        series_group_set = None
+        for series_rename_enum in iter_series_rename_match(type_series_rename_matcher, type_series_rename_mapping,
+                                                           series_description.value):
+            # The series group functions only read the dataset, so they run once for all matching patterns.
+            if series_group_set is None:
                 series_group_set = set()
-                series_group_set.add(series_rename_enum)
                 for series_group_fn in self.get_series_group_fn_list():
                     item_enum = series_group_fn(dicom_ds=dicom_ds)
                     if item_enum is not NullEnum.NULL:
@@ -1391,26 +1634,25 @@ class ASLProcessingStrategy(MRRenameSeriesProcessingStrategy):
                             series_group_set.update(item_enum)
                         else:
                             series_group_set.add(item_enum)
-                for series_rename_enum, series_rename_group_set in type_series_rename_dict.items():
-                    if series_group_set == series_rename_group_set:
-                        return series_rename_enum
+            series_rename_enum = type_series_rename_lookup.get(frozenset(series_group_set | {series_rename_enum}))
+            if series_rename_enum is not None:
+                return series_rename_enum
         return NullEnum.NULL
 
-    def process(self, dicom_ds: FileDataset) -> Union[BaseEnum, MRSeriesRenameEnum]:
+    def process(self, dicom_ds: FileDataset,
+                mr_acquisition_type_enum: Union[MRAcquisitionTypeEnum, NullEnum, None] = None) -> \
+            Union[BaseEnum, MRSeriesRenameEnum]:
         """Process the DICOM dataset for ASL series renaming.
 
         Parameters:
         dicom_ds (FileDataset): The DICOM dataset.
+        mr_acquisition_type_enum (MRAcquisitionTypeEnum): The MR acquisition type already read by the caller, read
+            from the dataset when None.
 
         Returns:
         Union[BaseEnum, MRSeriesRenameEnum]: The renamed series enumeration or NullEnum.NULL if no match is found.
         """
-        mr_acquisition_type_enum = self.mr_acquisition_type_processing_strategy.process(dicom_ds=dicom_ds)
-        if mr_acquisition_type_enum == MRAcquisitionTypeEnum.TYPE_3D:
-            return self.type_process(dicom_ds, self.type_3D_series_rename_mapping, self.type_3D_series_rename_dict)
-        if mr_acquisition_type_enum == NullEnum.NULL:
-            return self.type_process(dicom_ds, self.type_null_series_rename_mapping,self.type_null_series_rename_dict)
-        return NullEnum.NULL
+        return self.dispatch_type_process(dicom_ds, mr_acquisition_type_enum)
 
 
 class DSCProcessingStrategy(MRRenameSeriesProcessingStrategy):
@@ -1425,31 +1667,40 @@ class DSCProcessingStrategy(MRRenameSeriesProcessingStrategy):
         Mapping of series descriptions to corresponding regex patterns for null acquisitions.
     type_null_series_rename_dict : dict
         Mapping of DSCSeriesRenameEnum values to sets of attributes for null acquisitions.
+    type_null_series_rename_lookup : dict
+        Mapping of the frozen attribute sets of type_null_series_rename_dict to their DSCSeriesRenameEnum values.
     mr_acquisition_type : tuple
         Tuple containing MR acquisition types and NullEnum, in this case, 2D and null.
     series_group_fn_list : list
         List containing functions for extracting series group information.
     """
 
+    __slots__ = ()
+
     series_rename_mapping = {
-        DSCSeriesRenameEnum.DSC: re.compile('.*(AUTOPWI|Perfusion).*', re.IGNORECASE),
-        DSCSeriesRenameEnum.rCBF: re.compile('.*(CBF).*', re.IGNORECASE),
-        DSCSeriesRenameEnum.rCBV: re.compile('.*(CBV).*', re.IGNORECASE),
-        DSCSeriesRenameEnum.MTT: re.compile('.*(MTT).*', re.IGNORECASE),
+        DSCSeriesRenameEnum.DSC: DSC_PATTERN,
+        DSCSeriesRenameEnum.rCBF: CBF_PATTERN,
+        DSCSeriesRenameEnum.rCBV: CBV_PATTERN,
+        DSCSeriesRenameEnum.MTT: MTT_PATTERN,
     }
     type_2D_series_rename_mapping = {
-        DSCSeriesRenameEnum.DSC: re.compile('.*(AUTOPWI|Perfusion).*', re.IGNORECASE),
+        DSCSeriesRenameEnum.DSC: DSC_PATTERN,
     }
     type_null_series_rename_mapping = {
-        DSCSeriesRenameEnum.rCBF: re.compile('.*(CBF).*', re.IGNORECASE),
-        DSCSeriesRenameEnum.rCBV: re.compile('.*(CBV).*', re.IGNORECASE),
-        DSCSeriesRenameEnum.MTT: re.compile('.*(MTT).*', re.IGNORECASE),
+        DSCSeriesRenameEnum.rCBF: CBF_PATTERN,
+        DSCSeriesRenameEnum.rCBV: CBV_PATTERN,
+        DSCSeriesRenameEnum.MTT: MTT_PATTERN,
     }
     type_null_series_rename_dict = {
         DSCSeriesRenameEnum.rCBF: {DSCSeriesRenameEnum.rCBF},
         DSCSeriesRenameEnum.rCBV: {DSCSeriesRenameEnum.rCBV},
         DSCSeriesRenameEnum.MTT: {DSCSeriesRenameEnum.MTT},
     }
+    type_null_series_rename_lookup = get_series_rename_lookup(type_null_series_rename_dict)
+    type_null_series_rename_matcher = get_series_rename_matcher(type_null_series_rename_mapping)
+    # The lowercase keywords of DSC_PATTERN and of the type_null_series_rename_mapping patterns.
+    type_2D_series_rename_keyword = ('autopwi', 'perfusion')
+    type_null_series_rename_keyword = ('cbf', 'cbv', 'mtt')
     mr_acquisition_type: Tuple[Union[MRAcquisitionTypeEnum, NullEnum]] = (MRAcquisitionTypeEnum.TYPE_2D, NullEnum.NULL,)
     series_group_fn_list = []
 
@@ -1463,7 +1714,7 @@ class DSCProcessingStrategy(MRRenameSeriesProcessingStrategy):
         Returns:
         Union[BaseEnum, MRSeriesRenameEnum]: The functional processing name enumeration or NullEnum.NULL if not found.
         """
-        functional_processing_name = dicom_ds.get((0x51, 0x1002))
+        functional_processing_name = get_data_element(dicom_ds, 0x00511002)
         if functional_processing_name:
             for dsc_series_rename_enum in DSCSeriesRenameEnum.to_list():
                 if dsc_series_rename_enum.name == functional_processing_name.value:
@@ -1490,11 +1741,9 @@ class DSCProcessingStrategy(MRRenameSeriesProcessingStrategy):
         Returns:
         Union[BaseEnum, MRSeriesRenameEnum]: The renamed series enumeration or NullEnum.NULL if no match is found.
         """
-        series_description = dicom_ds.get((0x08, 0x103E))
-        for series_rename_enum, series_pattern in self.type_2D_series_rename_mapping.items():
-            match_result = series_pattern.match(series_description.value)
-            if match_result:
-                return series_rename_enum
+        series_description = get_data_element(dicom_ds, 0x0008103E)
+        if match_keyword_pattern(series_description.value, self.type_2D_series_rename_keyword, DSC_PATTERN):
+            return DSCSeriesRenameEnum.DSC
         return NullEnum.NULL
 
     def type_null_process(self, dicom_ds: FileDataset) -> Union[BaseEnum, MRSeriesRenameEnum]:
@@ -1506,33 +1755,54 @@ class DSCProcessingStrategy(MRRenameSeriesProcessingStrategy):
         Returns:
         Union[BaseEnum, MRSeriesRenameEnum]: The renamed series enumeration or NullEnum.NULL if no match is found.
         """
-        series_description = dicom_ds.get((0x08, 0x103E))
-        for series_rename_enum, series_pattern in self.type_null_series_rename_mapping.items():
-            match_result = series_pattern.match(series_description.value)
-            if match_result:
-                series_group_set = set()
-                for series_group_fn in self.get_series_group_fn_list():
-                    item_enum = series_group_fn(dicom_ds=dicom_ds)
-                    if item_enum is not NullEnum.NULL:
-                        if isinstance(item_enum, tuple):
-                            series_group_set.update(item_enum)
-                        else:
-                            series_group_set.add(item_enum)
-                for series_rename_enum, series_rename_group_set in self.type_null_series_rename_dict.items():
-                    if series_group_set == series_rename_group_set:
-                        return series_rename_enum
+        series_description = get_data_element(dicom_ds, 0x0008103E)
+        # The series group does not depend on which pattern matched, so one match of the alternation decides.
+        if match_keyword_pattern(series_description.value, self.type_null_series_rename_keyword,
+                                 self.type_null_series_rename_matcher):
+            series_group_set = set()
+            for series_group_fn in self.get_series_group_fn_list():
+                item_enum = series_group_fn(dicom_ds=dicom_ds)
+                if item_enum is not NullEnum.NULL:
+                    if isinstance(item_enum, tuple):
+                        series_group_set.update(item_enum)
+                    else:
+                        series_group_set.add(item_enum)
+            return self.type_null_series_rename_lookup.get(frozenset(series_group_set), NullEnum.NULL)
         return NullEnum.NULL
 
-    def process(self, dicom_ds: FileDataset) -> Union[BaseEnum, MRSeriesRenameEnum]:
+    def may_match_series_description(self, series_description: str,
+                                     mr_acquisition_type_enum: Union[MRAcquisitionTypeEnum, NullEnum]) -> bool:
+        """Check the series description against the pattern of the MR acquisition type.
+
+        Parameters:
+        series_description (str): The series description.
+        mr_acquisition_type_enum (MRAcquisitionTypeEnum): The MR acquisition type.
+
+        Returns:
+        bool: False if process returns NullEnum.NULL for the series description.
+        """
+        if mr_acquisition_type_enum == MRAcquisitionTypeEnum.TYPE_2D:
+            return match_keyword_pattern(series_description, self.type_2D_series_rename_keyword, DSC_PATTERN)
+        if mr_acquisition_type_enum == NullEnum.NULL:
+            return match_keyword_pattern(series_description, self.type_null_series_rename_keyword,
+                                         self.type_null_series_rename_matcher)
+        return False
+
+    def process(self, dicom_ds: FileDataset,
+                mr_acquisition_type_enum: Union[MRAcquisitionTypeEnum, NullEnum, None] = None) -> \
+            Union[BaseEnum, MRSeriesRenameEnum]:
         """Process the DICOM dataset for DSC series renaming.
 
         Parameters:
         dicom_ds (FileDataset): The DICOM dataset.
+        mr_acquisition_type_enum (MRAcquisitionTypeEnum): The MR acquisition type already read by the caller, read
+            from the dataset when None.
 
         Returns:
         Union[BaseEnum, MRSeriesRenameEnum]: The renamed series enumeration or NullEnum.NULL if no match is found.
         """
-        mr_acquisition_type_enum = self.mr_acquisition_type_processing_strategy.process(dicom_ds=dicom_ds)
+        if mr_acquisition_type_enum is None:
+            mr_acquisition_type_enum = self.mr_acquisition_type_processing_strategy.process(dicom_ds=dicom_ds)
         if mr_acquisition_type_enum == MRAcquisitionTypeEnum.TYPE_2D:
             return self.type_2D_process(dicom_ds)
         if mr_acquisition_type_enum == NullEnum.NULL:
@@ -1540,68 +1810,78 @@ class DSCProcessingStrategy(MRRenameSeriesProcessingStrategy):
         return NullEnum.NULL
 
 
-class CVRProcessingStrategy(MRRenameSeriesProcessingStrategy):
-    """A processing strategy for CVR (Cerebrovascular Reactivity) series renaming based on DICOM attributes.
+class SeriesGroupProcessingStrategy(MRRenameSeriesProcessingStrategy):
+    """A table-driven processing strategy for series renamed by a description keyword plus series group tags.
+
+    A subclass only declares its tables: the keyword patterns of series_rename_mapping, the body part
+    keywords of the description, the repetition times and the series groups of type_2D_series_rename_dict.
+    The series description decides the series enumeration and body parts once, the dataset's repetition
+    time completes the series group, which is then looked up by its bit mask.
 
     Attributes:
-    series_rename_mapping : dict
-        Mapping of series descriptions to corresponding regex patterns and MRSeriesRenameEnum values.
-    mr_acquisition_type : tuple
-        Tuple containing MR acquisition type 2D and NullEnum.
+    series_rename_keyword : dict
+        The lowercase keyword of each pattern in series_rename_mapping.
+    repetition_time_dict : dict
+        The repetition time enumerations by the string form of the repetition time.
+    body_part_keyword_dict : dict
+        The lowercase keyword of each body part named in the series description.
+    series_group_bit_dict : dict
+        The bit of each enumeration in type_2D_series_rename_dict.
+    type_2D_series_rename_lookup : dict
+        The series enumerations by the bit mask of their series group.
     """
 
-    series_rename_mapping = {
-        MRSeriesRenameEnum.CVR: re.compile('.*(CVR).*$', re.IGNORECASE),
-    }
-    mr_acquisition_type: Tuple[Union[MRAcquisitionTypeEnum, NullEnum]] = (MRAcquisitionTypeEnum.TYPE_2D,)
-    type_2D_series_rename_dict = {
-        MRSeriesRenameEnum.CVR2000_EAR: {MRSeriesRenameEnum.CVR, RepetitionTimeEnum.TR2000, BodyPartEnum.EAR},
-        MRSeriesRenameEnum.CVR2000_EYE: {MRSeriesRenameEnum.CVR, RepetitionTimeEnum.TR2000, BodyPartEnum.EYE},
-        MRSeriesRenameEnum.CVR2000: {MRSeriesRenameEnum.CVR, RepetitionTimeEnum.TR2000},
-        MRSeriesRenameEnum.CVR1000: {MRSeriesRenameEnum.CVR, RepetitionTimeEnum.TR1000},
-        MRSeriesRenameEnum.CVR: {MRSeriesRenameEnum.CVR},
-    }
-    series_group_fn_list = []
+    __slots__ = ()
 
-    # MRSeriesRenameEnum.CVR2000_EAR: re.compile('.*(CVR).*(2000).*(ear).*$', re.IGNORECASE),
-    # MRSeriesRenameEnum.CVR2000_EYE: re.compile('.*(CVR).*(2000).*(eye).*$', re.IGNORECASE),
-    # MRSeriesRenameEnum.CVR2000: re.compile('.*(CVR).*(2000).*$', re.IGNORECASE),
-    # MRSeriesRenameEnum.CVR1000: re.compile('.*(CVR).*(1000).*$', re.IGNORECASE),
-    @classmethod
-    def get_description_eye(cls, dicom_ds: FileDataset, ):
-        series_description = dicom_ds.get((0x08, 0x103E))
-        if series_description:
-            if BodyPartEnum.EYE.value.lower() in str(series_description.value).lower():
-                return BodyPartEnum.EYE
-        return NullEnum.NULL
+    series_rename_keyword: Dict[MRSeriesRenameEnum, str] = {}
+    repetition_time_dict: Dict[str, RepetitionTimeEnum] = {}
+    body_part_keyword_dict: Dict[BodyPartEnum, str] = {}
+    series_group_bit_dict: Dict[BaseEnum, int] = {}
+    type_2D_series_rename_lookup: Dict[int, MRSeriesRenameEnum] = {}
+    # Filled on first use, every subclass declares its own list.
+    series_group_fn_list: List[Callable] = []
 
     @classmethod
-    def get_description_ear(cls, dicom_ds: FileDataset, ):
-        series_description = dicom_ds.get((0x08, 0x103E))
-        if series_description:
-            if BodyPartEnum.EAR.value.lower() in str(series_description.value).lower():
-                return BodyPartEnum.EAR
-        return NullEnum.NULL
+    def get_description_body_part(cls, series_description: str) -> \
+            Union[BaseEnum, BodyPartEnum, Tuple[BodyPartEnum, ...]]:
+        """Get the body parts named in the series description.
+
+        The series description already fetched by process is passed in, so the tag is looked up
+        and lowercased once for all the body parts of body_part_keyword_dict.
+
+        Parameters:
+        series_description (str): The series description.
+
+        Returns:
+        Union[BaseEnum, BodyPartEnum, tuple]: The body part, a tuple of the body parts or NullEnum.NULL.
+        """
+        series_description = series_description.lower()
+        body_part_tuple = tuple(body_part_enum
+                                for body_part_enum, body_part_keyword in cls.body_part_keyword_dict.items()
+                                if body_part_keyword in series_description)
+        if len(body_part_tuple) == 0:
+            return NullEnum.NULL
+        if len(body_part_tuple) == 1:
+            return body_part_tuple[0]
+        return body_part_tuple
 
     @classmethod
-    def get_repetition_time(cls, dicom_ds: FileDataset, ):
+    def get_repetition_time(cls, dicom_ds: FileDataset) -> Union[BaseEnum, RepetitionTimeEnum]:
         """Get series information for repetition time sequences from the DICOM dataset.
 
         Parameters:
         dicom_ds (FileDataset): The DICOM dataset.
 
         Returns:
-        Union[BaseEnum, T2SeriesRenameEnum, SeriesEnum]: repetition time series information.
+        Union[BaseEnum, RepetitionTimeEnum]: repetition time series information.
         """
-        tr = str(dicom_ds[0x18, 0x80].value)
-        if tr == RepetitionTimeEnum.TR2000.value:
-            return RepetitionTimeEnum.TR2000
-        if tr == RepetitionTimeEnum.TR1000.value:
-            return RepetitionTimeEnum.TR1000
-        return NullEnum.NULL
+        repetition_time = get_data_element(dicom_ds, 0x00180080)
+        if repetition_time is None:
+            return NullEnum.NULL
+        return cls.repetition_time_dict.get(str(repetition_time.value), NullEnum.NULL)
 
     @classmethod
-    def get_series_group_fn_list(cls):
+    def get_series_group_fn_list(cls) -> List[Callable]:
         """Get the list of series group functions.
 
         Returns:
@@ -1609,119 +1889,177 @@ class CVRProcessingStrategy(MRRenameSeriesProcessingStrategy):
         """
         if len(cls.series_group_fn_list) == 0:
             cls.series_group_fn_list.append(cls.get_repetition_time)
-            cls.series_group_fn_list.append(cls.get_description_ear)
-            cls.series_group_fn_list.append(cls.get_description_eye)
         return cls.series_group_fn_list
 
-    def process(self, dicom_ds: FileDataset) -> Union[BaseEnum, MRSeriesRenameEnum]:
-        """Process the DICOM dataset for CVR series renaming.
+    @classmethod
+    @functools.lru_cache(maxsize=SERIES_DESCRIPTION_CACHE_SIZE)
+    def get_description_series_group(cls, series_description: str) -> Union[Tuple[MRSeriesRenameEnum, int], None]:
+        """Get the series enumeration and series group mask decided by the series description alone.
+
+        Parameters:
+        series_description (str): The series description.
+
+        Returns:
+        tuple: The matched series enumeration and the mask of it and any body parts, None if no pattern
+        matches. Cached per series description.
+        """
+        for series_rename_enum, series_pattern in cls.series_rename_mapping.items():
+            if match_keyword_pattern(series_description, cls.series_rename_keyword[series_rename_enum],
+                                     series_pattern):
+                series_group_mask = get_series_group_mask(cls.series_group_bit_dict, series_rename_enum)
+                body_part_enum = cls.get_description_body_part(series_description)
+                if body_part_enum is not NullEnum.NULL:
+                    series_group_mask |= get_series_group_mask(cls.series_group_bit_dict, body_part_enum)
+                return series_rename_enum, series_group_mask
+        return None
+
+    def may_match_series_description(self, series_description: str,
+                                     mr_acquisition_type_enum: Union[MRAcquisitionTypeEnum, NullEnum]) -> bool:
+        """Check if the series description matches a pattern of series_rename_mapping.
+
+        Parameters:
+        series_description (str): The series description.
+        mr_acquisition_type_enum (MRAcquisitionTypeEnum): The MR acquisition type.
+
+        Returns:
+        bool: False if process returns NullEnum.NULL for the series description.
+        """
+        return self.get_description_series_group(series_description) is not None
+
+    def process(self, dicom_ds: FileDataset,
+                mr_acquisition_type_enum: Union[MRAcquisitionTypeEnum, NullEnum, None] = None) -> \
+            Union[BaseEnum, MRSeriesRenameEnum]:
+        """Process the DICOM dataset for series renaming by its series group.
 
         Parameters:
         dicom_ds (FileDataset): The DICOM dataset.
+        mr_acquisition_type_enum (MRAcquisitionTypeEnum): The MR acquisition type already read by the caller, not
+            needed by this strategy.
 
         Returns:
         Union[BaseEnum, MRSeriesRenameEnum]: The renamed series enumeration or NullEnum.NULL if no match is found.
         """
-        series_description = dicom_ds.get((0x08, 0x103E))
-        for series_rename_enum, series_pattern in self.series_rename_mapping.items():
-            match_result = series_pattern.match(series_description.value)
-            if match_result:
-                series_group_set = set()
-                series_group_set.add(series_rename_enum)
-                for series_group_fn in self.get_series_group_fn_list():
-                    item_enum = series_group_fn(dicom_ds=dicom_ds)
-                    if item_enum is not NullEnum.NULL:
-                        if isinstance(item_enum, tuple):
-                            series_group_set.update(item_enum)
-                        else:
-                            series_group_set.add(item_enum)
-                for series_rename_enum, series_rename_group_set in self.type_2D_series_rename_dict.items():
-                    if series_group_set == series_rename_group_set:
-                        return series_rename_enum
-                return series_rename_enum
-        return NullEnum.NULL
-        # series_description = dicom_ds.get((0x08, 0x103E))
-        # for series_rename_enum, series_pattern in self.series_rename_mapping.items():
-        #     match_result = series_pattern.match(series_description.value)
-        #     if match_result:
-        #         return series_rename_enum
-        # return NullEnum.NULL
+        series_description = get_data_element(dicom_ds, 0x0008103E)
+        return self.get_series_rename_enum(dicom_ds, self.get_description_series_group(series_description.value))
 
+    def batch_process(self, dicom_ds_list: List[FileDataset],
+                      mr_acquisition_type_enum_list: Union[List[BaseEnum], None] = None) -> \
+            List[Union[BaseEnum, MRSeriesRenameEnum]]:
+        """Process a batch of DICOM datasets, deciding the description part once per distinct series description.
 
-class RestingProcessingStrategy(MRRenameSeriesProcessingStrategy):
-    """A processing strategy for renaming resting series based on DICOM attributes.
+        Parameters:
+        dicom_ds_list (List[FileDataset]): The DICOM datasets.
+        mr_acquisition_type_enum_list (list): The MR acquisition type of each dataset, not needed by this
+            strategy.
+
+        Returns:
+        List[Union[BaseEnum, MRSeriesRenameEnum]]: The same result as process for each dataset, in order.
+        """
+        series_description_list = [get_data_element(dicom_ds, 0x0008103E).value for dicom_ds in dicom_ds_list]
+        description_series_group_dict = {series_description: self.get_description_series_group(series_description)
+                                         for series_description in set(series_description_list)}
+        return [self.get_series_rename_enum(dicom_ds, description_series_group_dict[series_description])
+                for dicom_ds, series_description in zip(dicom_ds_list, series_description_list)]
+
+    def get_series_rename_enum(self, dicom_ds: FileDataset,
+                               description_series_group: Union[Tuple[MRSeriesRenameEnum, int], None]) -> \
+            Union[BaseEnum, MRSeriesRenameEnum]:
+        """Complete the series group decided by the series description with the dataset's own tags.
+
+        Parameters:
+        dicom_ds (FileDataset): The DICOM dataset.
+        description_series_group (tuple): The result of get_description_series_group for its series description.
+
+        Returns:
+        Union[BaseEnum, MRSeriesRenameEnum]: The renamed series enumeration or NullEnum.NULL if no match is found.
+        """
+        if description_series_group is None:
+            return NullEnum.NULL
+        series_rename_enum, series_group_mask = description_series_group
+        for series_group_fn in self.get_series_group_fn_list():
+            item_enum = series_group_fn(dicom_ds=dicom_ds)
+            if item_enum is not NullEnum.NULL:
+                series_group_mask |= get_series_group_mask(self.series_group_bit_dict, item_enum)
+        return self.type_2D_series_rename_lookup.get(series_group_mask, series_rename_enum)
+
+
+class CVRProcessingStrategy(SeriesGroupProcessingStrategy):
+    """A processing strategy for CVR (Cerebrovascular Reactivity) series renaming based on DICOM attributes.
 
     Attributes:
     series_rename_mapping : dict
         Mapping of series descriptions to corresponding regex patterns and MRSeriesRenameEnum values.
+    series_rename_keyword : dict
+        The lowercase keyword of each pattern in series_rename_mapping.
     mr_acquisition_type : tuple
         Tuple containing MR acquisition type 2D and NullEnum.
     """
 
+    __slots__ = ()
+
     series_rename_mapping = {
-        MRSeriesRenameEnum.RESTING: re.compile('.*(resting).*$', re.IGNORECASE),
+        MRSeriesRenameEnum.CVR: CVR_PATTERN,
+    }
+    series_rename_keyword = {
+        MRSeriesRenameEnum.CVR: 'cvr',
     }
     mr_acquisition_type: Tuple[Union[MRAcquisitionTypeEnum, NullEnum]] = (MRAcquisitionTypeEnum.TYPE_2D,)
-
     type_2D_series_rename_dict = {
-        MRSeriesRenameEnum.RESTING2000: {MRSeriesRenameEnum.RESTING, RepetitionTimeEnum.TR2000},
-        MRSeriesRenameEnum.RESTING: {MRSeriesRenameEnum.RESTING},
+        MRSeriesRenameEnum.CVR2000_EAR: {MRSeriesRenameEnum.CVR, RepetitionTimeEnum.TR2000, BodyPartEnum.EAR},
+        MRSeriesRenameEnum.CVR2000_EYE: {MRSeriesRenameEnum.CVR, RepetitionTimeEnum.TR2000, BodyPartEnum.EYE},
+        MRSeriesRenameEnum.CVR2000: {MRSeriesRenameEnum.CVR, RepetitionTimeEnum.TR2000},
+        MRSeriesRenameEnum.CVR1000: {MRSeriesRenameEnum.CVR, RepetitionTimeEnum.TR1000},
+        MRSeriesRenameEnum.CVR: {MRSeriesRenameEnum.CVR},
     }
+    # Built once from type_2D_series_rename_dict, the series group is looked up by the bit mask of its enums.
+    series_group_bit_dict = get_series_group_bit_dict(type_2D_series_rename_dict)
+    type_2D_series_rename_lookup = get_series_group_mask_lookup(series_group_bit_dict, type_2D_series_rename_dict)
+    # The repetition time is matched on its string form, so '2000.0' is not TR2000.
+    repetition_time_dict = {repetition_time_enum.value: repetition_time_enum
+                            for repetition_time_enum in (RepetitionTimeEnum.TR2000, RepetitionTimeEnum.TR1000)}
+    # Lowercased once here instead of on every series description.
+    body_part_keyword_dict = {body_part_enum: body_part_enum.value.lower()
+                              for body_part_enum in (BodyPartEnum.EAR, BodyPartEnum.EYE)}
     series_group_fn_list = []
 
-    @classmethod
-    def get_repetition_time(cls, dicom_ds: FileDataset, ):
-        """Get series information for repetition time sequences from the DICOM dataset.
-
-        Parameters:
-        dicom_ds (FileDataset): The DICOM dataset.
+    # MRSeriesRenameEnum.CVR2000_EAR: re.compile('.*(CVR).*(2000).*(ear).*$', re.IGNORECASE),
+    # MRSeriesRenameEnum.CVR2000_EYE: re.compile('.*(CVR).*(2000).*(eye).*$', re.IGNORECASE),
+    # MRSeriesRenameEnum.CVR2000: re.compile('.*(CVR).*(2000).*$', re.IGNORECASE),
+    # MRSeriesRenameEnum.CVR1000: re.compile('.*(CVR).*(1000).*$', re.IGNORECASE),
 
-        Returns:
-        Union[BaseEnum, T2SeriesRenameEnum, SeriesEnum]: repetition time series information.
-        """
-        tr = str(dicom_ds[0x18, 0x80].value)
-        if tr == RepetitionTimeEnum.TR2000.value:
-            return RepetitionTimeEnum.TR2000
-        return NullEnum.NULL
 
-    @classmethod
-    def get_series_group_fn_list(cls):
-        """Get the list of series group functions.
+class RestingProcessingStrategy(SeriesGroupProcessingStrategy):
+    """A processing strategy for renaming resting series based on DICOM attributes.
 
-        Returns:
-        list: List of functions for extracting series group information.
-        """
-        if len(cls.series_group_fn_list) == 0:
-            cls.series_group_fn_list.append(cls.get_repetition_time)
-        return cls.series_group_fn_list
+    Attributes:
+    series_rename_mapping : dict
+        Mapping of series descriptions to corresponding regex patterns and MRSeriesRenameEnum values.
+    series_rename_keyword : dict
+        The lowercase keyword of each pattern in series_rename_mapping.
+    mr_acquisition_type : tuple
+        Tuple containing MR acquisition type 2D and NullEnum.
+    """
 
-    def process(self, dicom_ds: FileDataset) -> Union[BaseEnum, MRSeriesRenameEnum]:
-        """Process the DICOM dataset for resting series renaming.
+    __slots__ = ()
 
-        Parameters:
-        dicom_ds (FileDataset): The DICOM dataset.
+    series_rename_mapping = {
+        MRSeriesRenameEnum.RESTING: RESTING_PATTERN,
+    }
+    series_rename_keyword = {
+        MRSeriesRenameEnum.RESTING: 'resting',
+    }
+    mr_acquisition_type: Tuple[Union[MRAcquisitionTypeEnum, NullEnum]] = (MRAcquisitionTypeEnum.TYPE_2D,)
 
-        Returns:
-        Union[BaseEnum, MRSeriesRenameEnum]: The renamed series enumeration or NullEnum.NULL if no match is found.
-        """
-        series_description = dicom_ds.get((0x08, 0x103E))
-        for series_rename_enum, series_pattern in self.series_rename_mapping.items():
-            match_result = series_pattern.match(series_description.value)
-            if match_result:
-                series_group_set = set()
-                series_group_set.add(series_rename_enum)
-                for series_group_fn in self.get_series_group_fn_list():
-                    item_enum = series_group_fn(dicom_ds=dicom_ds)
-                    if item_enum is not NullEnum.NULL:
-                        if isinstance(item_enum, tuple):
-                            series_group_set.update(item_enum)
-                        else:
-                            series_group_set.add(item_enum)
-                for series_rename_enum, series_rename_group_set in self.type_2D_series_rename_dict.items():
-                    if series_group_set == series_rename_group_set:
-                        return series_rename_enum
-                return series_rename_enum
-        return NullEnum.NULL
+    type_2D_series_rename_dict = {
+        MRSeriesRenameEnum.RESTING2000: {MRSeriesRenameEnum.RESTING, RepetitionTimeEnum.TR2000},
+        MRSeriesRenameEnum.RESTING: {MRSeriesRenameEnum.RESTING},
+    }
+    # Built once from type_2D_series_rename_dict, the series group is looked up by the bit mask of its enums.
+    series_group_bit_dict = get_series_group_bit_dict(type_2D_series_rename_dict)
+    type_2D_series_rename_lookup = get_series_group_mask_lookup(series_group_bit_dict, type_2D_series_rename_dict)
+    # The repetition time is matched on its string form, so '2000.0' is not TR2000.
+    repetition_time_dict = {RepetitionTimeEnum.TR2000.value: RepetitionTimeEnum.TR2000}
+    series_group_fn_list = []
 
 
 class DTIProcessingStrategy(MRRenameSeriesProcessingStrategy):
@@ -1738,19 +2076,26 @@ class DTIProcessingStrategy(MRRenameSeriesProcessingStrategy):
         List containing functions for extracting series group information.
     """
 
+    __slots__ = ()
+
     series_rename_mapping = {
-        MRSeriesRenameEnum.DTI32D: re.compile('.*(DTI).*', re.IGNORECASE),
-        MRSeriesRenameEnum.DTI64D: re.compile('.*(DTI).*', re.IGNORECASE),
+        MRSeriesRenameEnum.DTI32D: DTI_PATTERN,
+        MRSeriesRenameEnum.DTI64D: DTI_PATTERN,
     }
     series_rename_dict = {
         MRSeriesRenameEnum.DTI32D: {DTISeriesEnum.DTI32D},
         MRSeriesRenameEnum.DTI64D: {DTISeriesEnum.DTI64D}
     }
     mr_acquisition_type: Tuple[Union[MRAcquisitionTypeEnum, NullEnum]] = (MRAcquisitionTypeEnum.TYPE_2D,)
+    type_process_dict = {
+        MRAcquisitionTypeEnum.TYPE_2D: (series_rename_mapping,
+                                        get_series_rename_matcher(series_rename_mapping),
+                                        get_series_rename_lookup(series_rename_dict)),
+    }
     series_group_fn_list = []
 
     @classmethod
-    def get_series_group_fn_list(cls):
+    def get_series_group_fn_list(cls) -> List[Callable]:
         """Get the list of series group functions.
 
         Returns:
@@ -1761,7 +2106,7 @@ class DTIProcessingStrategy(MRRenameSeriesProcessingStrategy):
         return cls.series_group_fn_list
 
     @classmethod
-    def get_dti_diffusion(cls, dicom_ds: FileDataset):
+    def get_dti_diffusion(cls, dicom_ds: FileDataset) -> Union[BaseEnum, DTISeriesEnum]:
         """Get the DTI diffusion information from the DICOM dataset.
 
         Parameters:
@@ -1770,59 +2115,57 @@ class DTIProcessingStrategy(MRRenameSeriesProcessingStrategy):
         Returns:
         Union[BaseEnum, DTISeriesEnum]: The DTI diffusion enumeration or NullEnum.NULL if not found.
         """
-        dti_diffusion = dicom_ds.get((0x19, 0x10E0))
+        dti_diffusion = get_data_element(dicom_ds, 0x001910E0)
         if dti_diffusion:
             for dti_diffusion_rename_enum in DTISeriesEnum.to_list():
                 if dti_diffusion_rename_enum.value == dti_diffusion.value:
                     return dti_diffusion_rename_enum
         return NullEnum.NULL
 
-    def type_process(self, dicom_ds: FileDataset, type_series_rename_mapping, type_series_rename_dict) -> Union[
-        BaseEnum, MRSeriesRenameEnum]:
+    def type_process(self, dicom_ds: FileDataset, type_series_rename_mapping, type_series_rename_matcher,
+                     type_series_rename_lookup) -> Union[BaseEnum, MRSeriesRenameEnum]:
         """Process the DICOM dataset for DTI series renaming.
 
         Parameters:
         dicom_ds (FileDataset): The DICOM dataset.
         type_series_rename_mapping : dict
             Mapping of series descriptions to corresponding regex patterns and MRSeriesRenameEnum values.
-        type_series_rename_dict : dict
-            Mapping of series enumeration to corresponding DTISeriesEnum values.
+        type_series_rename_matcher : re.Pattern
+            The patterns of type_series_rename_mapping as one alternation.
+        type_series_rename_lookup : dict
+            The series enumeration of each DTISeriesEnum value set, as a frozenset.
 
         Returns:
         Union[BaseEnum, MRSeriesRenameEnum]: The renamed series enumeration or NullEnum.NULL if no match is found.
         """
-        series_description = dicom_ds.get((0x08, 0x103E))
-        for series_rename_enum, series_pattern in type_series_rename_mapping.items():
-            match_result = series_pattern.match(series_description.value)
-            if match_result:
-                series_group_set = set()
-                for series_group_fn in self.get_series_group_fn_list():
-                    item_enum = series_group_fn(dicom_ds=dicom_ds)
-                    if item_enum is not NullEnum.NULL:
-                        if isinstance(item_enum, tuple):
-                            series_group_set.update(item_enum)
-                        else:
-                            series_group_set.add(item_enum)
-                for series_rename_enum, series_rename_group_set in type_series_rename_dict.items():
-                    if series_group_set == series_rename_group_set:
-                        return series_rename_enum
-
+        series_description = get_data_element(dicom_ds, 0x0008103E)
+        # The series group does not depend on which pattern matched, so one match of the alternation decides.
+        if match_series_rename_matcher(type_series_rename_matcher, series_description.value):
+            series_group_set = set()
+            for series_group_fn in self.get_series_group_fn_list():
+                item_enum = series_group_fn(dicom_ds=dicom_ds)
+                if item_enum is not NullEnum.NULL:
+                    if isinstance(item_enum, tuple):
+                        series_group_set.update(item_enum)
+                    else:
+                        series_group_set.add(item_enum)
+            return type_series_rename_lookup.get(frozenset(series_group_set), NullEnum.NULL)
         return NullEnum.NULL
 
-    def process(self, dicom_ds: FileDataset) -> Union[BaseEnum, MRSeriesRenameEnum]:
+    def process(self, dicom_ds: FileDataset,
+                mr_acquisition_type_enum: Union[MRAcquisitionTypeEnum, NullEnum, None] = None) -> \
+            Union[BaseEnum, MRSeriesRenameEnum]:
         """Process the DICOM dataset for DTI series renaming.
 
         Parameters:
         dicom_ds (FileDataset): The DICOM dataset.
+        mr_acquisition_type_enum (MRAcquisitionTypeEnum): The MR acquisition type already read by the caller, read
+            from the dataset when None.
 
         Returns:
         Union[BaseEnum, MRSeriesRenameEnum]: The renamed series enumeration or NullEnum.NULL if no match is found.
         """
-        mr_acquisition_type_enum = self.mr_acquisition_type_processing_strategy.process(dicom_ds=dicom_ds)
-        if mr_acquisition_type_enum == MRAcquisitionTypeEnum.TYPE_2D:
-            return self.type_process(dicom_ds, self.series_rename_mapping, self.series_rename_dict)
-
-        return NullEnum.NULL
+        return self.dispatch_type_process(dicom_ds, mr_acquisition_type_enum)
 
 
 class ConvertManager:
@@ -1835,6 +2178,10 @@ class ConvertManager:
         An instance of the MRAcquisitionTypeProcessingStrategy for determining MR acquisition type.
     processing_strategy_list : list
         List of MRRenameSeriesProcessingStrategy instances for various series renaming strategies.
+    processing_strategy_dict : dict
+        The processing strategies that apply to each modality and MR acquisition type pair, in list order.
+    processing_strategy_modality_set : frozenset
+        The modalities handled by at least one processing strategy.
     _input_path : pathlib.Path
         The input path containing the DICOM files.
     output_path : pathlib.Path
@@ -1848,10 +2195,7 @@ class ConvertManager:
                                                                         EADCProcessingStrategy(),
                                                                         SWANProcessingStrategy(),
                                                                         ESWANProcessingStrategy(),
-                                                                        MRABrainProcessingStrategy(),
-                                                                        MRANeckProcessingStrategy(),
-                                                                        MRAVRBrainProcessingStrategy(),
-                                                                        MRAVRNeckProcessingStrategy(),
+                                                                        MRAProcessingStrategy(),
                                                                         T1ProcessingStrategy(),
                                                                         T2ProcessingStrategy(),
                                                                         ASLProcessingStrategy(),
@@ -1859,6 +2203,11 @@ class ConvertManager:
                                                                         RestingProcessingStrategy(),
                                                                         CVRProcessingStrategy(),
                                                                         DTIProcessingStrategy()]
+    # The strategies that apply to each (modality, MR acquisition type) pair, filled on first use.
+    processing_strategy_dict: Dict[tuple, List[MRRenameSeriesProcessingStrategy]] = {}
+    # Datasets of any other modality match no strategy, so their MR acquisition type is never read.
+    processing_strategy_modality_set = frozenset(processing_strategy.modality
+                                                 for processing_strategy in processing_strategy_list)
 
     def __init__(self, input_path: Union[str, pathlib.Path], output_path: Union[str, pathlib.Path], *args, **kwargs):
         """Initialize the ConvertManager.
@@ -1870,6 +2219,21 @@ class ConvertManager:
 
         self._input_path = pathlib.Path(input_path)
         self.output_path = pathlib.Path(output_path)
+        self._output_path_str = str(self.output_path)
+        self._created_dir_set = set()
+        self._created_dir_lock = threading.Lock()
+
+    def __getstate__(self):
+        # The lock cannot be pickled when the manager is sent to a ProcessPoolExecutor worker;
+        # every worker process keeps its own created folder cache.
+        state = self.__dict__.copy()
+        del state['_created_dir_lock']
+        state['_created_dir_set'] = set()
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._created_dir_lock = threading.Lock()
 
     @staticmethod
     def get_output_study(dicom_ds: FileDataset, output_path: pathlib.Path):
@@ -1890,6 +2254,22 @@ class ConvertManager:
             return output_study
         return None
 
+    def get_output_study_str(self, dicom_ds: FileDataset) -> Union[str, None]:
+        """Get the output study folder as a str, avoiding a pathlib.Path per DICOM file.
+
+        Parameters:
+        dicom_ds (FileDataset): The DICOM dataset.
+
+        Returns:
+        str: The output study folder path.
+        """
+        study_folder_name = self.get_study_folder_name(dicom_ds=dicom_ds)
+        if self.output_path.name == study_folder_name:
+            return self._output_path_str
+        if study_folder_name:
+            return os.path.join(self._output_path_str, study_folder_name)
+        return None
+
     @staticmethod
     def get_study_folder_name(dicom_ds: FileDataset):
         """Generate the study folder name based on DICOM attributes.
@@ -1900,11 +2280,11 @@ class ConvertManager:
         Returns:
         str: The generated study folder name.
         """
-        modality = dicom_ds[0x08, 0x60].value
-        patient_id = dicom_ds[0x10, 0x20].value
-        accession_number = dicom_ds[0x08, 0x50].value
+        modality = get_required_data_element(dicom_ds, 0x00080060).value
+        patient_id = get_required_data_element(dicom_ds, 0x00100020).value
+        accession_number = get_required_data_element(dicom_ds, 0x00080050).value
         # (0008,0020)	Study Date	20160722
-        study_date = dicom_ds.get((0x08, 0x20), None)
+        study_date = get_data_element(dicom_ds, 0x00080020)
         if study_date is None:
             return None
         else:
@@ -1920,47 +2300,351 @@ class ConvertManager:
         Returns:
         str: The renamed series name.
         """
+        mr_acquisition_type_enum, processing_strategy_list = self.get_dataset_processing_strategy(dicom_ds)
+        for processing_strategy in processing_strategy_list:
+            series_enum = processing_strategy.process(dicom_ds=dicom_ds,
+                                                      mr_acquisition_type_enum=mr_acquisition_type_enum)
+            if series_enum is not NullEnum.NULL:
+                return series_enum.value
+        return ''
+
+    def get_dataset_processing_strategy(self, dicom_ds: FileDataset) -> \
+            Tuple[Union[MRAcquisitionTypeEnum, NullEnum, None], List[MRRenameSeriesProcessingStrategy]]:
+        """Get the MR acquisition type of a DICOM dataset and the processing strategies that apply to it.
+
+        The modality is checked first, the MR acquisition type is only read for a modality some
+        strategy handles. It is read once here and passed to every strategy of the dataset. The
+        strategies that cannot rename the series description are left out.
+
+        Parameters:
+        dicom_ds (FileDataset): The DICOM dataset.
+
+        Returns:
+        tuple: The MR acquisition type, None if it was not read, and the applicable strategies in
+        processing_strategy_list order.
+        """
         modality_enum = self.modality_processing_strategy.process(dicom_ds=dicom_ds)
+        if modality_enum not in self.processing_strategy_modality_set:
+            return None, []
         mr_acquisition_type_enum = self.mr_acquisition_type_processing_strategy.process(dicom_ds=dicom_ds)
+        series_description = get_data_element(dicom_ds, 0x0008103E)
+        # Without a plain series description every strategy runs, and fails, as it would on its own.
+        if series_description is None or not isinstance(series_description.value, str):
+            return mr_acquisition_type_enum, self.get_processing_strategy_list(modality_enum,
+                                                                               mr_acquisition_type_enum)
+        return mr_acquisition_type_enum, self.get_description_processing_strategy_list(
+            modality_enum, mr_acquisition_type_enum, series_description.value)
+
+    def get_dataset_processing_strategy_list(self, dicom_ds: FileDataset) -> List[MRRenameSeriesProcessingStrategy]:
+        """Get the processing strategies that apply to a DICOM dataset.
+
+        Parameters:
+        dicom_ds (FileDataset): The DICOM dataset.
+
+        Returns:
+        List[MRRenameSeriesProcessingStrategy]: The applicable strategies, in processing_strategy_list order.
+        """
+        return self.get_dataset_processing_strategy(dicom_ds)[1]
+
+    @classmethod
+    def get_processing_strategy_list(cls, modality_enum, mr_acquisition_type_enum) -> \
+            List[MRRenameSeriesProcessingStrategy]:
+        """Get the processing strategies that apply to a modality and MR acquisition type.
+
+        The strategies are selected once per pair, so renaming a dataset only walks the strategies
+        that can match it instead of testing every strategy's modality and acquisition types.
+
+        Parameters:
+        modality_enum: The modality of the DICOM dataset.
+        mr_acquisition_type_enum: The MR acquisition type of the DICOM dataset.
+
+        Returns:
+        List[MRRenameSeriesProcessingStrategy]: The applicable strategies, in processing_strategy_list order.
+        """
+        key = (modality_enum, mr_acquisition_type_enum)
+        processing_strategy_list = cls.processing_strategy_dict.get(key)
+        if processing_strategy_list is None:
+            processing_strategy_list = [processing_strategy for processing_strategy in cls.processing_strategy_list
+                                        if modality_enum == processing_strategy.modality and
+                                        mr_acquisition_type_enum in processing_strategy.mr_acquisition_type]
+            cls.processing_strategy_dict[key] = processing_strategy_list
+        return processing_strategy_list
+
+    @classmethod
+    @functools.lru_cache(maxsize=SERIES_DESCRIPTION_CACHE_SIZE)
+    def get_description_processing_strategy_list(cls, modality_enum, mr_acquisition_type_enum,
+                                                 series_description: str) -> List[MRRenameSeriesProcessingStrategy]:
+        """Get the processing strategies that can rename a series description of a modality and MR acquisition type.
+
+        Every strategy checks its own patterns once per series description here, so the datasets of
+        a series only run the strategies whose patterns match it, usually one or two.
+
+        Parameters:
+        modality_enum (ModalityEnum): The modality.
+        mr_acquisition_type_enum (MRAcquisitionTypeEnum): The MR acquisition type.
+        series_description (str): The series description.
+
+        Returns:
+        List[MRRenameSeriesProcessingStrategy]: The strategies in processing_strategy_list order, cached per
+        modality, MR acquisition type and series description.
+        """
+        return [processing_strategy
+                for processing_strategy in cls.get_processing_strategy_list(modality_enum, mr_acquisition_type_enum)
+                if processing_strategy.may_match_series_description(series_description, mr_acquisition_type_enum)]
+
+    def rename_dicom_path_batch(self, dicom_ds_list: List[FileDataset]) -> List[str]:
+        """Rename a batch of DICOM series, evaluating each processing strategy over the whole batch.
+
+        The modality and MR acquisition type of every dataset are extracted once, then each processing
+        strategy only processes the datasets it applies to that are not renamed yet. Every dataset gets
+        the same series name as rename_dicom_path would return for it.
+
+        Parameters:
+        dicom_ds_list (List[FileDataset]): The DICOM datasets.
+
+        Returns:
+        List[str]: The renamed series name of each dataset, '' if no strategy matched.
+        """
+        mr_acquisition_type_enum_list, processing_strategy_list_list = [], []
+        for dicom_ds in dicom_ds_list:
+            try:
+                mr_acquisition_type_enum, processing_strategy_list = self.get_dataset_processing_strategy(dicom_ds)
+            except:
+                # A dataset whose tags cannot be read is left unrenamed, the rest of the batch goes on.
+                print(traceback.format_exc())
+                print('Unknown except')
+                mr_acquisition_type_enum, processing_strategy_list = None, []
+            mr_acquisition_type_enum_list.append(mr_acquisition_type_enum)
+            processing_strategy_list_list.append(processing_strategy_list)
+        rename_series_list = [''] * len(dicom_ds_list)
+        pending_index_list = list(range(len(dicom_ds_list)))
         for processing_strategy in self.processing_strategy_list:
-            if modality_enum == processing_strategy.modality:
-                for mr_acquisition_type in processing_strategy.mr_acquisition_type:
-                    if mr_acquisition_type_enum == mr_acquisition_type:
-                        series_enum = processing_strategy.process(dicom_ds=dicom_ds)
-                        if series_enum is not NullEnum.NULL:
-                            return series_enum.value
-        return ''
+            if len(pending_index_list) == 0:
+                break
+            index_list = [index for index in pending_index_list
+                          if processing_strategy in processing_strategy_list_list[index]]
+            if len(index_list) == 0:
+                continue
+            try:
+                series_enum_list = processing_strategy.batch_process(
+                    [dicom_ds_list[index] for index in index_list],
+                    [mr_acquisition_type_enum_list[index] for index in index_list])
+            except:
+                # Isolate the dataset that failed so the rest of the batch is still renamed.
+                series_enum_list = []
+                for index in index_list:
+                    try:
+                        series_enum_list.append(processing_strategy.process(
+                            dicom_ds=dicom_ds_list[index],
+                            mr_acquisition_type_enum=mr_acquisition_type_enum_list[index]))
+                    except:
+                        print(traceback.format_exc())
+                        print('Unknown except')
+                        series_enum_list.append(None)
+            resolved_index_set = set()
+            for index, series_enum in zip(index_list, series_enum_list):
+                if series_enum is None:
+                    resolved_index_set.add(index)
+                elif series_enum is not NullEnum.NULL:
+                    rename_series_list[index] = series_enum.value
+                    resolved_index_set.add(index)
+            pending_index_list = [index for index in pending_index_list if index not in resolved_index_set]
+        return rename_series_list
+
+    def make_dirs(self, path: str):
+        """Create a folder and its parents once per ConvertManager instead of once per DICOM file.
+
+        Parameters:
+        path (str): The folder path.
+        """
+        with self._created_dir_lock:
+            if path in self._created_dir_set:
+                return
+        os.makedirs(path, exist_ok=True)
+        with self._created_dir_lock:
+            self._created_dir_set.add(path)
+
+    def copy_instances(self, instances: Union[str, pathlib.Path], output_study: Union[str, pathlib.Path],
+                       rename_series: str):
+        """Copy a DICOM file into its renamed series folder.
+
+        Parameters:
+        instances (Union[str, pathlib.Path]): The DICOM file path.
+        output_study (Union[str, pathlib.Path]): The output study folder path.
+        rename_series (str): The renamed series name.
+        """
+        output_study_series = os.path.join(output_study, rename_series)
+        self.make_dirs(output_study_series)
+        output_study_instances = os.path.join(output_study_series, os.path.basename(instances))
+        # Claim the destination with an exclusive create instead of stat-ing it first; an existing file is kept
+        # as is. shutil.copyfile then copies in the kernel where the platform supports it.
+        try:
+            os.close(os.open(output_study_instances, os.O_WRONLY | os.O_CREAT | os.O_EXCL))
+        except FileExistsError:
+            return
+        try:
+            shutil.copyfile(instances, output_study_instances)
+        except:
+            # Do not leave a claimed empty file behind, the next run would skip it.
+            os.remove(output_study_instances)
+            raise
+
+    @staticmethod
+    def read_dicom_header(instances: Union[str, pathlib.Path]) -> FileDataset:
+        """Read the DICOM header of a file, up to the pixel data.
+
+        The first PREFETCH_HEADER_SIZE bytes are read with a single read call and parsed from
+        memory. Files whose header does not end inside them are read again from the path, so
+        the result is the same as dcmread(instances, stop_before_pixels=True).
+
+        Parameters:
+        instances (Union[str, pathlib.Path]): The DICOM file path.
+
+        Returns:
+        FileDataset: The DICOM dataset without the pixel data.
+        """
+        from pydicom import dcmread
+        with open(instances, 'rb', buffering=0) as f:
+            header = f.read(PREFETCH_HEADER_SIZE)
+        read_size = len(header)
+        header_io = io.BytesIO(header)
+        try:
+            dicom_ds = dcmread(header_io, stop_before_pixels=True)
+        except:
+            if read_size < PREFETCH_HEADER_SIZE:
+                raise
+            dicom_ds = None
+        # Parsing stopped before the end of the header bytes only when the pixel data was reached.
+        if dicom_ds is not None and (read_size < PREFETCH_HEADER_SIZE or header_io.tell() < read_size):
+            return dicom_ds
+        return dcmread(str(instances), stop_before_pixels=True)
 
     def rename_process(self, instances, *args, **kwargs):
-        """Process the renaming of DICOM files in the specified instances list.
+        """Process the renaming of a single DICOM file.
 
         Parameters:
-        instances_list (list): List of DICOM file instances.
+        instances (pathlib.Path): The DICOM file instance.
         """
+        # pydicom is imported on first use so importing this module stays cheap.
+        import pydicom.errors
         try:
-            dicom_ds = dcmread(str(instances), stop_before_pixels=True)
-            output_study = self.get_output_study(dicom_ds=dicom_ds, output_path=self.output_path)
+            dicom_ds = self.read_dicom_header(instances)
+            output_study = self.get_output_study_str(dicom_ds=dicom_ds)
             if output_study:
                 rename_series = self.rename_dicom_path(dicom_ds=dicom_ds)
                 if len(rename_series) > 0:
-                    os.makedirs(output_study, exist_ok=True)
-                    output_study_series = output_study.joinpath(rename_series)
-                    if output_study_series.exists():
-                        pass
-                    else:
-                        output_study_series.mkdir(exist_ok=True)
-                    output_study_instances = output_study_series.joinpath(instances.name)
-                    if output_study_instances.exists():
-                        pass
-                    else:
-                        # print(output_study_instances)
-                        shutil.copyfile(instances, output_study_instances)
+                    self.copy_instances(instances=instances, output_study=output_study, rename_series=rename_series)
         except (pydicom.errors.InvalidDicomError, pydicom.errors.BytesLengthException):
             print(f'except {instances}')
         except:
             print(traceback.format_exc())
             print('Unknown except')
 
+    def rename_process_batch(self, instances_list, *args, **kwargs):
+        """Process the renaming of a batch of DICOM files.
+
+        The headers of the whole batch are read first and classified together with
+        rename_dicom_path_batch, then every file is copied to its renamed series folder.
+
+        Parameters:
+        instances_list (list): List of DICOM file instances.
+        """
+        import pydicom.errors
+        row_list = []
+        for instances in instances_list:
+            try:
+                dicom_ds = self.read_dicom_header(instances)
+                output_study = self.get_output_study_str(dicom_ds=dicom_ds)
+                if output_study:
+                    row_list.append((instances, dicom_ds, output_study))
+            except (pydicom.errors.InvalidDicomError, pydicom.errors.BytesLengthException):
+                print(f'except {instances}')
+            except:
+                print(traceback.format_exc())
+                print('Unknown except')
+        rename_series_list = self.rename_dicom_path_batch(dicom_ds_list=[row[1] for row in row_list])
+        for (instances, dicom_ds, output_study), rename_series in zip(row_list, rename_series_list):
+            if len(rename_series) > 0:
+                try:
+                    self.copy_instances(instances=instances, output_study=output_study, rename_series=rename_series)
+                except:
+                    print(traceback.format_exc())
+                    print('Unknown except')
+
+    @staticmethod
+    def prefetch_instance(instances: Union[str, pathlib.Path]):
+        """Ask the kernel to read ahead the DICOM header of a single file.
+
+        Parameters:
+        instances (Union[str, pathlib.Path]): The DICOM file path.
+        """
+        try:
+            fd = os.open(instances, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.posix_fadvise(fd, 0, PREFETCH_HEADER_SIZE, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    @classmethod
+    def prefetch_instance_list(cls, instances_list: List[Union[str, pathlib.Path]]):
+        """Ask the kernel to read ahead the DICOM headers of a list of files, in order.
+
+        Parameters:
+        instances_list (List[Union[str, pathlib.Path]]): List of DICOM file instances.
+        """
+        for instances in instances_list:
+            cls.prefetch_instance(instances)
+
+    def prefetch_headers(self, instances_list: List[Union[str, pathlib.Path]], prefetch_executor: ThreadPoolExecutor):
+        """Issue read-ahead hints for the DICOM headers without waiting for them.
+
+        The hints are submitted to the prefetch thread pool of the run so the kernel can fill the page
+        cache while the rename workers are parsing. The files are split into one strided slice per
+        prefetch worker, so only PREFETCH_WORKERS tasks are queued instead of one per file, and the
+        workers move through the list in order. This is a no-op on platforms without posix_fadvise.
+
+        Parameters:
+        instances_list (List[Union[str, pathlib.Path]]): List of DICOM file instances.
+        prefetch_executor (ThreadPoolExecutor): The prefetch thread pool of the run.
+        """
+        if not hasattr(os, 'posix_fadvise') or len(instances_list) == 0:
+            return
+        for index in range(PREFETCH_WORKERS):
+            prefetch_executor.submit(self.prefetch_instance_list, instances_list[index::PREFETCH_WORKERS])
+
+    def rename_instances_list(self, instances_list: List[Union[str, pathlib.Path]],
+                              executor: Union[ThreadPoolExecutor, None], desc: str):
+        """Rename the DICOM files in batches of RENAME_BATCH_SIZE.
+
+        Parameters:
+        instances_list (List[Union[str, pathlib.Path]]): List of DICOM file instances.
+        executor (Union[ThreadPoolExecutor, None]): Thread pool executor for parallel processing.
+        desc (str): The progress bar description.
+        """
+        from tqdm.auto import tqdm
+        batch_list = [instances_list[index:index + RENAME_BATCH_SIZE]
+                      for index in range(0, len(instances_list), RENAME_BATCH_SIZE)]
+        if executor:
+            # Keep only a bounded number of batches in flight instead of submitting every batch up front.
+            batch_iter = iter(batch_list)
+            inflight = {executor.submit(self.rename_process_batch, batch)
+                        for batch in itertools.islice(batch_iter, RENAME_INFLIGHT_BATCH_COUNT)}
+            with tqdm(total=len(batch_list), desc=desc, ) as progress_bar:
+                while inflight:
+                    done, inflight = wait(inflight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+                    progress_bar.update(len(done))
+                    for batch in itertools.islice(batch_iter, len(done)):
+                        inflight.add(executor.submit(self.rename_process_batch, batch))
+        else:
+            for batch in tqdm(batch_list, total=len(batch_list), desc=desc, ):
+                self.rename_process_batch(instances_list=batch)
+
     def run(self, executor: Union[ThreadPoolExecutor, None] = None):
         """Run the DICOM file conversion and renaming process.
 
@@ -1968,28 +2652,20 @@ class ConvertManager:
         executor (Union[ThreadPoolExecutor, None]): Thread pool executor for parallel processing.
         """
         is_dir_flag = all(list(map(lambda x: x.is_dir(), self.input_path.iterdir())))
-        if is_dir_flag:
-            # for sub_dir in tqdm(list(self.input_path.iterdir()),desc=f'sub dir'):
-            for sub_dir in self.input_path.iterdir():
-                instances_list = list(sub_dir.rglob('*.dcm'))
-                if executor:
-                    # executor.map(self.rename_process, (instances_list,))
-                    results = list(tqdm(executor.map(self.rename_process, instances_list), total=len(instances_list),
-                                        desc=f'dir:{sub_dir.name}', ))
-                else:
-                    for instances in tqdm(instances_list, total=len(instances_list),
-                                          desc=f'dir:{sub_dir.name}', ):
-                        self.rename_process(instances=instances)
-        else:
-            instances_list = list(self.input_path.rglob('*.dcm'))
-            if executor:
-                # executor.map(self.rename_process, (instances_list,))
-                results = list(tqdm(executor.map(self.rename_process, instances_list),
-                                    total=len(instances_list), desc=f'dir:{self.input_path.name}'),
-                               )
+        # One prefetch thread pool for the whole run, joined before returning.
+        with ThreadPoolExecutor(max_workers=PREFETCH_WORKERS) as prefetch_executor:
+            if is_dir_flag:
+                # for sub_dir in tqdm(list(self.input_path.iterdir()),desc=f'sub dir'):
+                for sub_dir in self.input_path.iterdir():
+                    instances_list = list(scandir_walk(sub_dir, '.dcm'))
+                    self.prefetch_headers(instances_list, prefetch_executor)
+                    self.rename_instances_list(instances_list=instances_list, executor=executor,
+                                               desc=f'dir:{sub_dir.name}')
             else:
-                for instances in tqdm(instances_list):
-                    self.rename_process(instances=instances)
+                instances_list = list(scandir_walk(self.input_path, '.dcm'))
+                self.prefetch_headers(instances_list, prefetch_executor)
+                self.rename_instances_list(instances_list=instances_list, executor=executor,
+                                           desc=f'dir:{self.input_path.name}')
 
     @property
     def input_path(self):
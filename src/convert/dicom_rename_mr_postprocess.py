@@ -1,15 +1,18 @@
+from __future__ import annotations
+
 import argparse
 import pathlib
 import re
 import traceback
 from abc import ABCMeta, abstractmethod
 from concurrent.futures import ThreadPoolExecutor
-from typing import List, Union
-from tqdm.auto import tqdm
-from pydicom import dcmread, FileDataset, Dataset,DataElement
+from typing import List, Union, TYPE_CHECKING
 import orjson
 from .config import MRSeriesRenameEnum,DSCSeriesRenameEnum,ASLSEQSeriesRenameEnum
 
+if TYPE_CHECKING:
+    from pydicom import FileDataset
+
 
 class ProcessingStrategy(metaclass=ABCMeta):
 
@@ -88,6 +91,8 @@ class MRProcessingStrategy(ProcessingStrategy):
     }
 
     def process(self, study_path: pathlib.Path, *args, **kwargs):
+        from pydicom import dcmread
+        from tqdm.auto import tqdm
         series_folder_list = list(filter(lambda x: x.is_dir() and x.name != '.meta', study_path.iterdir()))
         meta_folder = study_path.joinpath('.meta')
         meta_folder.mkdir(exist_ok=True)
@@ -118,7 +123,7 @@ class MRProcessingStrategy(ProcessingStrategy):
                     file.write(orjson.dumps(dicom_header, option=orjson.OPT_APPEND_NEWLINE))
             except :
                 print(str(series_folder))
-                print(traceback.print_exc())
+                print(traceback.format_exc())
 
 
 class MRDicomProcessingStrategy(ProcessingStrategy):
@@ -255,6 +260,8 @@ class MRDicomProcessingStrategy(ProcessingStrategy):
         return series_folder_list
 
     def process(self, study_path: pathlib.Path, *args, **kwargs):
+        from pydicom import dcmread
+        from tqdm.auto import tqdm
         series_folder_list = self.get_series_folder_list(study_path=study_path)
         for series_folder in tqdm(series_folder_list, desc=f'MRDicom : {study_path.name}'):
             dicom_list = list(map(lambda x: (dcmread(str(x), force=True), x), series_folder.iterdir()))
@@ -287,6 +294,8 @@ class MRDwiAdcProcessingStrategy(ProcessingStrategy):
         return series_folder_list
 
     def process(self, study_path: pathlib.Path, *args, **kwargs):
+        from pydicom import dcmread
+        from tqdm.auto import tqdm
         series_folder_list = self.get_series_folder_list(study_path=study_path)
         for series_folder in tqdm(series_folder_list, desc=f'{study_path.name}'):
             dicom_list = list(
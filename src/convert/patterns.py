@@ -0,0 +1,26 @@
+import re
+
+# Series description patterns shared by more than one rename mapping, compiled once at import.
+FLAIR_PATTERN = re.compile('(FLAIR)', re.IGNORECASE)
+CUBE_PATTERN = re.compile('.*(CUBE).*', re.IGNORECASE)
+T2_PATTERN = re.compile('.*(T2).*', re.IGNORECASE)
+DSC_PATTERN = re.compile('.*(AUTOPWI|Perfusion).*', re.IGNORECASE)
+CBF_PATTERN = re.compile('.*(CBF).*', re.IGNORECASE)
+CBV_PATTERN = re.compile('.*(CBV).*', re.IGNORECASE)
+MTT_PATTERN = re.compile('.*(MTT).*', re.IGNORECASE)
+DTI_PATTERN = re.compile('.*(DTI).*', re.IGNORECASE)
+# Patterns of the single-pattern strategies, matched directly by their process methods.
+ADC_PATTERN = re.compile('.*(?<!e)(ADC|Apparent Diffusion Coefficient).*', re.IGNORECASE)
+EADC_PATTERN = re.compile('.*(eADC).*', re.IGNORECASE)
+SWAN_PATTERN = re.compile('.*(?<!e)(SWAN).*', re.IGNORECASE)
+ESWAN_PATTERN = re.compile('.*(SWAN).*', re.IGNORECASE)
+
+# The MRA patterns below rely on lookaheads. The MRA strategies only fall back to them for descriptions
+# that are not single-line ASCII. They stay on the stdlib re module, because the third-party regex
+# module was slower on three of the four patterns.
+MRA_BRAIN_PATTERN = re.compile('.+(TOF)(((?!Neck).)*)$', re.IGNORECASE)
+MRA_NECK_PATTERN = re.compile('.*(TOF).*((Neck+).*)$', re.IGNORECASE)
+MRAVR_BRAIN_PATTERN = re.compile('((?!TOF|Neck).)*(MRA)((?!Neck).)*$', re.IGNORECASE)
+MRAVR_NECK_PATTERN = re.compile('((?!TOF).)*(Neck.*MRA)|(MRA.*Neck).*$', re.IGNORECASE)
+CVR_PATTERN = re.compile('.*(CVR).*$', re.IGNORECASE)
+RESTING_PATTERN = re.compile('.*(resting).*$', re.IGNORECASE)
@@ -0,0 +1,92 @@
+import os
+from typing import Iterator, Union
+
+from pydicom.dataelem import DataElement
+
+
+def scandir_walk(root: Union[str, os.PathLike], suffix: str) -> Iterator[str]:
+    """Recursively yield the paths of the files under root whose name ends with suffix, ignoring case.
+
+    Uses os.scandir so directory entries are classified from the readdir result instead of
+    a stat per entry, and yields plain strings so callers that only count or group the
+    files do not pay for a pathlib.Path per file. Symlinked directories are not followed,
+    matching pathlib.Path.rglob.
+
+    Parameters
+    ----------
+    root : Union[str, os.PathLike]
+        The directory to walk.
+    suffix : str
+        The file name suffix to match, e.g. '.dcm' also matches '.DCM'.
+
+    Returns
+    -------
+    Iterator[str]
+        The matching file paths.
+    """
+    suffix = suffix.lower()
+    suffix_len = len(suffix)
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name[-suffix_len:].lower() == suffix:
+                        yield entry.path
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            continue
+
+
+def get_data_element(dicom_ds, tag: int):
+    """Get a data element of a DICOM dataset, the same as dicom_ds.get(tag).
+
+    Once pydicom has decoded an element it is returned straight from the dataset's element
+    dict, skipping the tag conversion Dataset.get does on every call. Anything else found there,
+    such as an element still in its raw form read from the file, goes through Dataset.get, which
+    decodes it. The element dict is a pydicom internal: the shortcut was measured on pydicom 3.0,
+    and if the dict ever holds something other than DataElement objects every read simply takes
+    the Dataset.get path.
+
+    Parameters
+    ----------
+    dicom_ds : Dataset
+        The DICOM dataset.
+    tag : int
+        The element tag as a single int, e.g. 0x0008103E for the series description.
+
+    Returns
+    -------
+    Union[DataElement, None]
+        The data element, or None if the dataset does not contain it.
+    """
+    data_element = dicom_ds._dict.get(tag)
+    if isinstance(data_element, DataElement):
+        return data_element
+    return dicom_ds.get(tag)
+
+
+def get_required_data_element(dicom_ds, tag: int):
+    """Get a data element of a DICOM dataset, the same as dicom_ds[tag].
+
+    A decoded element is returned straight from the dataset's element dict like get_data_element.
+    Anything else, a missing element or one still in its raw form, goes through Dataset.__getitem__,
+    which raises KeyError or decodes it.
+
+    Parameters
+    ----------
+    dicom_ds : Dataset
+        The DICOM dataset.
+    tag : int
+        The element tag as a single int, e.g. 0x00180080 for the repetition time.
+
+    Returns
+    -------
+    DataElement
+        The data element.
+    """
+    data_element = dicom_ds._dict.get(tag)
+    if isinstance(data_element, DataElement):
+        return data_element
+    return dicom_ds[tag]
@@ -27,7 +27,6 @@ class UploadSqlManager:
 
     def upload(self, study_path):
         meta_path      = study_path.joinpath('.meta')
-        meta_path_list = list(meta_path.iterdir())
         for series_path in study_path.iterdir():
             if series_path.is_file():
                 # nii.gz .meta/series.jsonline mapping
@@ -79,7 +78,7 @@ if __name__ == '__main__':
     upload_manager = UploadSqlManager(args.input)
     executor = ThreadPoolExecutor(max_workers=args.work)
     with executor:
-        upload_manager.run()
+        upload_manager.run(executor=executor)
 
 # patient
 # # study
@@ -1,4 +1,13 @@
+import asyncio
+import contextlib
+import os
+import atexit
+import logging
+import logging.handlers
+import queue
 import re
+import sys
+import threading
 
 from . import SQL_WEB_URL
 
@@ -11,19 +20,93 @@ import botocore.response
 from boto3.session import Session
 import boto3  # 加载boto3 skd包
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.poolmanager import PoolKey
+
+try:
+    # Streams the multipart body from the file instead of building it in memory.
+    from requests_toolbelt.multipart.encoder import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
+
+try:
+    # Only needed by UploadManager.run_async.
+    import aiohttp
+except ImportError:
+    aiohttp = None
 
 import pathlib
 
 from pydicom import dcmread, FileDataset,Dataset,DataElement
 import orjson
 
+# Streamed bodies are sent in blocks of this size instead of the 8KiB/16KiB http.client/urllib3 default.
+UPLOAD_BLOCKSIZE = 64 * 1024
+# Read buffer of the uploaded files, so the small reads of the request body are served from one large read.
+UPLOAD_READ_BUFFER = 1024 * 1024
+# Connection limit of the aiohttp connector used by UploadManager.run_async.
+UPLOAD_ASYNC_CONNECTION_LIMIT = 64
+# Send UPLOAD_BATCH_SIZE files per POST as file_0, file_url_0, file_1, file_url_1, ...
+# Off by default, the file endpoint has to accept multi-file requests.
+UPLOAD_MULTI_PART_BATCH = False
+UPLOAD_BATCH_SIZE = 32
+
+
+logger = logging.getLogger(__name__)
+# Started by setup_logging on first use, importing the module has no side effects.
+_log_listener = None
+_log_listener_lock = threading.Lock()
+
+
+def setup_logging():
+    # Worker threads only put log records on a queue, one listener thread formats and writes them,
+    # so the uploads do not contend on the stdout lock. Started once per process, stopped at exit.
+    global _log_listener
+    with _log_listener_lock:
+        if _log_listener is not None:
+            return
+        log_queue = queue.SimpleQueue()
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        _log_listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+        _log_listener.start()
+        atexit.register(_log_listener.stop)
+
+
+class BlocksizeHTTPAdapter(HTTPAdapter):
+
+    def init_poolmanager(self, *args, **kwargs):
+        # urllib3 < 2 has no blocksize pool key and keeps its default.
+        if 'key_blocksize' in PoolKey._fields:
+            kwargs.setdefault('blocksize', UPLOAD_BLOCKSIZE)
+        super().init_poolmanager(*args, **kwargs)
+
 
 class UploadManager:
     web_url = SQL_WEB_URL
 
-    def __init__(self, input_path: Union[str, pathlib.Path],
+    def __init__(self, input_path: Union[str, pathlib.Path], work: int = 4,
                  *args, **kwargs):
         self._input_path = pathlib.Path(input_path)
+        self.work = work
+        self._file_url = f'{self.web_url.rstrip("/")}/file/'
+        # One session for every upload so the keep-alive connections are reused between files.
+        self._session = requests.Session()
+        # The pool never blocks and holds at least one connection per thread, so workers do not queue on it.
+        adapter = BlocksizeHTTPAdapter(pool_connections=max(work, 16), pool_maxsize=max(work * 2, 32),
+                                       pool_block=False)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+
+    def close(self):
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
     # @staticmethod
     # def get_dicom_data(dicom_ds: FileDataset):
@@ -91,50 +174,142 @@ class UploadManager:
     #     self.upload_patient_study(study_path=study_path)
     #     self.upload_series(study_path=study_path)
 
-    def upload_file_meta_data_to_sql(self, study_path: pathlib.Path, path: pathlib.Path, is_niigz_meta=True):
+    @staticmethod
+    def get_file_key(study_path: pathlib.Path, path: pathlib.Path, is_niigz_meta=True):
         if is_niigz_meta:
-            Key = f'{study_path.name}/{path.parent.name}/{path.name}'
-        else:
-            Key = f'{study_path.name}/{path.name}'
-        files = {'file': open(path, 'rb')}
-        form_data = dict(file_url= Key)
-        print('file_url', Key)
+            return f'{study_path.name}/{path.parent.name}/{path.name}'
+        return f'{study_path.name}/{path.name}'
+
+    def upload_file_meta_data_to_sql(self, study_path: pathlib.Path, path: pathlib.Path, is_niigz_meta=True):
+        Key = self.get_file_key(study_path=study_path, path=path, is_niigz_meta=is_niigz_meta)
+        logger.info('file_url %s', Key)
         # form_data = dict(file_name= path.name,
         #                  file_size= object.get('ContentLength'),
         #                  file_datetime= object.get('LastModified'),
         #                  file_type= path.suffix,
         #                  file_url= Key,)
-        with requests.Session() as session:
-            response = session.post(url=f'{self.web_url}file/',files=files, data=form_data)
-            print(response)
+        with open(path, 'rb', buffering=UPLOAD_READ_BUFFER) as file:
+            if MultipartEncoder is None:
+                response = self._session.post(url=self._file_url, files={'file': file},
+                                              data=dict(file_url=Key))
+            else:
+                encoder = MultipartEncoder(fields=[('file_url', Key),
+                                                   ('file', (path.name, file, 'application/octet-stream'))])
+                response = self._session.post(url=self._file_url, data=encoder,
+                                              headers={'Content-Type': encoder.content_type})
+        logger.info('%s', response)
 
-    def upload(self, study_path):
+    def upload_file_batch_meta_data_to_sql(self, job_list):
+        with contextlib.ExitStack() as stack:
+            form_data = {}
+            file_list = []
+            for index, (study_path, path, is_niigz_meta) in enumerate(job_list):
+                Key = self.get_file_key(study_path=study_path, path=path, is_niigz_meta=is_niigz_meta)
+                logger.info('file_url %s', Key)
+                file = stack.enter_context(open(path, 'rb', buffering=UPLOAD_READ_BUFFER))
+                form_data[f'file_url_{index}'] = Key
+                file_list.append((f'file_{index}', (path.name, file, 'application/octet-stream')))
+            if MultipartEncoder is None:
+                response = self._session.post(url=self._file_url, files=file_list, data=form_data)
+            else:
+                encoder = MultipartEncoder(fields=list(form_data.items()) + file_list)
+                response = self._session.post(url=self._file_url, data=encoder,
+                                              headers={'Content-Type': encoder.content_type})
+        logger.info('%s', response)
+
+    async def upload_file_meta_data_to_sql_async(self, session, semaphore: asyncio.Semaphore,
+                                                 study_path: pathlib.Path, path: pathlib.Path, is_niigz_meta=True):
+        Key = self.get_file_key(study_path=study_path, path=path, is_niigz_meta=is_niigz_meta)
+        async with semaphore:
+            logger.info('file_url %s', Key)
+            # The file is opened in the default executor so a slow open does not stall the event loop,
+            # aiohttp reads the payload through the executor as well.
+            loop = asyncio.get_running_loop()
+            with await loop.run_in_executor(None, open, path, 'rb', UPLOAD_READ_BUFFER) as file:
+                form_data = aiohttp.FormData()
+                form_data.add_field('file_url', Key)
+                form_data.add_field('file', file, filename=path.name, content_type='application/octet-stream')
+                async with session.post(self._file_url, data=form_data) as response:
+                    logger.info('<Response [%s]>', response.status)
+
+    def get_upload_jobs(self, study_path):
         # info_pattern = re.compile('(\d{8})_(\d{8})_(MR|CT)_(\w*)')
         # print(info_pattern.match(study_path.name).groups())
-        for series_path in study_path.iterdir():
-            if series_path.is_dir():
-                for path in series_path.iterdir():
-                    self.upload_file_meta_data_to_sql(study_path=study_path, path=path)
-            if series_path.is_file():
-                self.upload_file_meta_data_to_sql(study_path=study_path, path=series_path,is_niigz_meta=False)
+        # The whole study is listed in one os.scandir pass, which classifies the entries from the
+        # directory listing instead of a stat per Path.
+        job_list = []
+        with os.scandir(study_path) as series_entry_iter:
+            for series_entry in series_entry_iter:
+                # DirEntry answers is_dir()/is_file() from the d_type of the listing, only symlinks are stat-ed
+                if series_entry.is_dir():
+                    with os.scandir(series_entry.path) as entry_iter:
+                        for entry in entry_iter:
+                            if entry.is_file():
+                                job_list.append((entry.inode(), entry.path, True))
+                elif series_entry.is_file():
+                    job_list.append((series_entry.inode(), series_entry.path, False))
+        # Inode order approximates the on-disk order, so the files are read mostly sequentially.
+        job_list.sort(key=lambda job: job[0])
+        return [(study_path, pathlib.Path(path), is_niigz_meta) for _, path, is_niigz_meta in job_list]
 
+    def get_upload_job_batch_list(self, study_path):
+        job_list = self.get_upload_jobs(study_path=study_path)
+        return [job_list[index:index + UPLOAD_BATCH_SIZE] for index in range(0, len(job_list), UPLOAD_BATCH_SIZE)]
 
-    def run(self, executor: Union[ThreadPoolExecutor, None] = None):
+    def upload(self, study_path):
+        if UPLOAD_MULTI_PART_BATCH:
+            for job_list in self.get_upload_job_batch_list(study_path=study_path):
+                self.upload_file_batch_meta_data_to_sql(job_list=job_list)
+            return
+        for study_path, path, is_niigz_meta in self.get_upload_jobs(study_path=study_path):
+            self.upload_file_meta_data_to_sql(study_path=study_path, path=path, is_niigz_meta=is_niigz_meta)
+
+    def submit_upload(self, executor: ThreadPoolExecutor, study_path):
+        if UPLOAD_MULTI_PART_BATCH:
+            for job_list in self.get_upload_job_batch_list(study_path=study_path):
+                executor.submit(self.upload_file_batch_meta_data_to_sql, job_list=job_list)
+            return
+        # One task per file, so a large study is spread over every worker instead of a single one.
+        for study_path, path, is_niigz_meta in self.get_upload_jobs(study_path=study_path):
+            executor.submit(self.upload_file_meta_data_to_sql,
+                            study_path=study_path, path=path, is_niigz_meta=is_niigz_meta)
+
+    def get_study_path_list(self):
         is_dir_flag = all(list(map(lambda x: x.is_dir(), self.input_path.iterdir())))
         if is_dir_flag:
-            study_path_list = list(self.input_path.iterdir())
-            for study_path in study_path_list:
-                if executor:
-                    future = executor.submit(self.upload, study_path=study_path)
-                else:
-                    self.upload(study_path=study_path)
-                # break
-        else:
-            if executor:
-                future = executor.submit(self.upload, study_path=self.input_path)
-            else:
-                self.upload(study_path=self.input_path)
-            # break
+            return list(self.input_path.iterdir())
+        return [self.input_path]
+
+    async def run_async(self):
+        # Every upload shares one event loop thread; the semaphore bounds the uploads in flight.
+        semaphore = asyncio.Semaphore(self.work * 4)
+        connector = aiohttp.TCPConnector(limit=UPLOAD_ASYNC_CONNECTION_LIMIT, keepalive_timeout=60)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            task_list = []
+            for study_path in self.get_study_path_list():
+                for job_study_path, path, is_niigz_meta in self.get_upload_jobs(study_path=study_path):
+                    task_list.append(self.upload_file_meta_data_to_sql_async(session=session, semaphore=semaphore,
+                                                                             study_path=job_study_path, path=path,
+                                                                             is_niigz_meta=is_niigz_meta))
+            result_list = await asyncio.gather(*task_list, return_exceptions=True)
+        for result in result_list:
+            if isinstance(result, BaseException):
+                logger.error('upload failed', exc_info=(type(result), result, result.__traceback__))
+
+    def run(self, executor: Union[ThreadPoolExecutor, None] = None, use_async: bool = False):
+        setup_logging()
+        if use_async:
+            if aiohttp is None:
+                raise ImportError('UploadManager.run(use_async=True) requires aiohttp')
+            asyncio.run(self.run_async())
+            return
+        if executor is None:
+            # Uploads are network bound, so they run on a thread pool of self.work threads by default.
+            with ThreadPoolExecutor(max_workers=self.work) as executor:
+                self.run(executor=executor)
+            return
+        for study_path in self.get_study_path_list():
+            self.submit_upload(executor=executor, study_path=study_path)
 
     @property
     def input_path(self):